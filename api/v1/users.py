@@ -0,0 +1,146 @@
+#!/usr/bin/python3
+"""
+Users management API endpoints.
+
+This module provides API endpoints for user administration,
+including listing users and retrieving single user profiles.
+"""
+from flask import Blueprint, request, jsonify
+from sqlalchemy import bindparam, func, select
+from models.user import User
+from api.v1.auth import require_auth, require_role, get_db
+
+users_bp = Blueprint('users', __name__)
+
+# Invariant statements built once at import (see the other modules)
+_USER_COLUMNS = (
+    User.id,
+    User.username,
+    User.first_name,
+    User.last_name,
+    User.is_active,
+    User.created_at,
+    User.last_login
+)
+
+# Sort keys are whitelisted to indexed/selected columns; anything else
+# falls back to the default instead of reaching arbitrary attributes
+_SORT_COLUMNS = {
+    'created_at': User.created_at,
+    'username': User.username,
+    'last_login': User.last_login
+}
+
+_GET_USER_STMT = select(*_USER_COLUMNS, User.email).where(
+    User.id == bindparam('user_id'),
+    User.deleted_at.is_(None)
+)
+
+
+@users_bp.route('/', methods=['GET'])
+@require_role('admin')
+def list_users():
+    """
+    List users endpoint with pagination (admin only).
+
+    Query params:
+        page: Page number (default: 1)
+        per_page: Items per page (default: 20, max: 100)
+        sort: Sort column ('created_at', 'username' or 'last_login')
+        count: Set to 1 to include the total (extra window count)
+
+    Returns:
+        List of users with pagination metadata
+    """
+    db = get_db()
+
+    page = request.args.get('page', 1, type=int)
+    per_page = min(request.args.get('per_page', 20, type=int), 100)
+    want_count = request.args.get('count') == '1'
+
+    # Column select, no ORM hydration; totals are opt-in and ride the
+    # page query as a window count (same shape as list_posts)
+    columns = list(_USER_COLUMNS)
+    if want_count:
+        columns.append(func.count().over().label('total_count'))
+
+    sort = _SORT_COLUMNS.get(request.args.get('sort', 'created_at'),
+                             User.created_at)
+
+    rows = db.execute(
+        select(*columns)
+        .where(User.deleted_at.is_(None))
+        .order_by(sort.desc())
+        .offset((page - 1) * per_page)
+        .limit(per_page + 1)
+    ).all()
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    pagination = {
+        'page': page,
+        'per_page': per_page,
+        'has_more': has_more
+    }
+    if want_count:
+        if rows:
+            total = rows[0].total_count
+        else:
+            # Page past the end: no rows carry the window count, so
+            # fall back to a real COUNT (same pattern as list_posts)
+            total = db.execute(
+                select(func.count())
+                .select_from(User)
+                .where(User.deleted_at.is_(None))
+            ).scalar()
+        pagination['total'] = total
+        pagination['pages'] = (total + per_page - 1) // per_page
+
+    return jsonify({
+        'users': [{
+            'id': row.id,
+            'username': row.username,
+            'first_name': row.first_name,
+            'last_name': row.last_name,
+            'is_active': row.is_active,
+            'created_at': row.created_at.isoformat(),
+            'last_login': row.last_login.isoformat() if row.last_login else None
+        } for row in rows],
+        'pagination': pagination
+    })
+
+
+@users_bp.route('/<int:user_id>', methods=['GET'])
+@require_auth
+def get_user(user_id):
+    """
+    Get single user by id endpoint.
+
+    The email address is only included for the user themselves and
+    for admins.
+
+    URL params:
+        user_id: User ID
+
+    Returns:
+        User object if found
+    """
+    db = get_db()
+
+    row = db.execute(_GET_USER_STMT, {'user_id': user_id}).first()
+    if row is None:
+        return jsonify({'error': 'User not found'}), 404
+
+    response = {
+        'id': row.id,
+        'username': row.username,
+        'first_name': row.first_name,
+        'last_name': row.last_name,
+        'is_active': row.is_active,
+        'created_at': row.created_at.isoformat(),
+        'last_login': row.last_login.isoformat() if row.last_login else None
+    }
+    if user_id == request.user_id or 'admin' in request.roles:
+        response['email'] = row.email
+
+    return jsonify(response)
@@ -11,9 +11,13 @@ from api.v1.posts import posts_bp
 from api.v1.categories import categories_bp
 from api.v1.tags import tags_bp
 from api.v1.comments import comments_bp
-from config.database import engine
+from api.v1.users import users_bp
+from config.database import engine, Session
 from models import Base
 from utils.redis_client import RedisClient
+from utils.json_provider import OrjsonProvider
+# Importing registers the ORM cache-invalidation listeners
+import utils.cache_invalidation  # noqa: F401
 import logging
 
 def create_app():
@@ -24,7 +28,10 @@ def create_app():
         Flask: Configured Flask application instance
     """
     app = Flask(__name__)
-    
+
+    # Serialize all responses with orjson (see utils.json_provider)
+    app.json = OrjsonProvider(app)
+
     # Configuration
     app.config['SECRET_KEY'] = 'your-secret-key'  # Change in production
     
@@ -37,10 +44,16 @@ def create_app():
     app.register_blueprint(categories_bp, url_prefix='/api/v1/categories')
     app.register_blueprint(tags_bp, url_prefix='/api/v1/tags')
     app.register_blueprint(comments_bp, url_prefix='/api/v1/comments')
+    app.register_blueprint(users_bp, url_prefix='/api/v1/users')
     app.logger.setLevel(logging.DEBUG)
     # Create database tables
     Base.metadata.create_all(bind=engine)
     
+    # Return the request-scoped session at the end of every request
+    @app.teardown_appcontext
+    def remove_session(exception=None):
+        Session.remove()
+
     # Error handlers
     @app.errorhandler(404)
     def not_found(error):
@@ -4,7 +4,7 @@ Mysql Database initialization module
 """
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, scoped_session
 from os import getenv
 
 DATABASE_URL = (
@@ -13,12 +13,26 @@ DATABASE_URL = (
 )
 
 
+# Pool sized for concurrent workers; pre_ping replaces stale MySQL
+# connections (wait_timeout kills idle ones) with a cheap ping instead
+# of a mid-request failure, and recycle stays under the server default.
 engine = create_engine(
     DATABASE_URL,
-    pool_size=5,
-    max_overflow=10,
+    pool_size=10,
+    max_overflow=20,
     pool_timeout=30,
-    pool_recycle=3600
+    pool_recycle=1800,
+    pool_pre_ping=True
 )
 
-SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+# expire_on_commit=False keeps already-loaded attributes readable after
+# commit without a refresh SELECT; handlers read-then-commit-then-
+# serialize, so every response was paying that extra query.
+SessionLocal = sessionmaker(
+    bind=engine, autocommit=False, autoflush=False, expire_on_commit=False
+)
+
+# Thread-scoped registry: every get_db() call within one request returns
+# the same session (and pooled connection) instead of checking out a new
+# one per query. The app removes the session at request teardown.
+Session = scoped_session(SessionLocal)
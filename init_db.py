@@ -52,7 +52,7 @@ def create_admin_user(session):
     
     # Create admin user
     password = 'admin123'
-    hashed_pass, salt = hash_password(password)
+    hashed_pass = hash_password(password)
     
     # First, check if admin user already exists
     existing_admin = session.query(User).filter_by(username='admin').first()
@@ -9,7 +9,7 @@ Classes:
     AuditActionType: Enum defining possible audit action types
     AuditLog: Represents a system activity log entry
 """
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Enum, Index, insert
 from sqlalchemy.orm import relationship
 from datetime import datetime
 import enum
@@ -78,7 +78,13 @@ class AuditLog(Base):
     def log_action(session, user_id, action, entity_type, entity_id, changes,
                    ip_address=None, user_agent=None):
         """
-        Create and save an audit log entry.
+        Create an audit log entry on the given session.
+
+        The entry is written as part of the caller's transaction so the
+        audit INSERT and the business write share a single commit. It
+        goes through a Core insert rather than an ORM add: log rows are
+        append-only with no relationships to cascade, so the identity
+        map and unit-of-work bookkeeping would be pure overhead.
 
         Args:
             session: SQLAlchemy session
@@ -90,14 +96,14 @@ class AuditLog(Base):
             ip_address: Origin IP address
             user_agent: Browser/client user agent string
         """
-        log_entry = AuditLog(
-            user_id=user_id,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            changes=json.dumps(changes) if changes else None,
-            ip_address=ip_address,
-            user_agent=user_agent
+        session.execute(
+            insert(AuditLog.__table__).values(
+                user_id=user_id,
+                action=action,
+                entity_type=entity_type,
+                entity_id=entity_id,
+                changes=json.dumps(changes) if changes else None,
+                ip_address=ip_address,
+                user_agent=user_agent
+            )
         )
-        session.add(log_entry)
-        session.commit()
@@ -43,6 +43,7 @@ class Comment(Base):
     content = Column(Text, nullable=False)
     is_approved = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     deleted_at = Column(DateTime, nullable=True)
 
     # Relationships
@@ -50,8 +51,12 @@ class Comment(Base):
     user = relationship('User', back_populates='comments')
     parent = relationship('Comment', remote_side=[id], backref='replies')
 
-    # Indexes
+    # Indexes. The composite index matches get_comments exactly —
+    # equality columns first, then the sort column — so the per-post
+    # listing is an index range scan with no filesort.
     __table_args__ = (
         Index('idx_post_id', post_id),
         Index('idx_created_at', created_at),
+        Index('idx_comments_post_approved_created',
+              post_id, is_approved, deleted_at, created_at),
     )
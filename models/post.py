@@ -97,13 +97,16 @@ class Post(Base):
     def validate_slug(self, key, slug):
         return validate_slug(slug)
 
-    # Indexes
+    # Indexes. The FULLTEXT index backs MATCH ... AGAINST search in
+    # list_posts; an unindexable LIKE '%term%' scan is the alternative.
     __table_args__ = (
         Index('idx_slug', 'slug'),
         Index('idx_status', 'status'),
         Index('idx_created_at', 'created_at'),
         Index('idx_published_at', 'published_at'),
         Index('idx_category_id', 'category_id'),
+        Index('idx_posts_fulltext', 'title', 'content',
+              mysql_prefix='FULLTEXT'),
     )
 
 # Event listeners for automatic calculations
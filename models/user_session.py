@@ -7,7 +7,7 @@ This module defines the `UserSession` class, representing active user sessions.
 Classes:
     UserSession: Tracks user sessions, including session tokens and expiration.
 """
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from models import Base
@@ -27,10 +27,48 @@ class UserSession(Base):
 
     id = Column(Integer, primary_key=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
-    session_token = Column(String(255), unique=True, nullable=False)
+    # token_urlsafe(24) yields 32 chars; a tight column keeps the
+    # unique index compact (more keys per B-tree page)
+    session_token = Column(String(64), unique=True, nullable=False)
     expires_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
     user_agent = Column(String(255))
     ip_address = Column(String(45))
     # Relationships
     user = relationship('User', back_populates='user_sessions')
+
+    # Indexes
+    __table_args__ = (
+        Index('idx_user_sessions_expires_at', 'expires_at'),
+    )
+
+    @classmethod
+    def cleanup_expired(cls, session, batch_size=10000):
+        """
+        Delete expired sessions in bounded batches.
+
+        An unbounded DELETE scans and write-locks the table for its
+        whole duration; deleting in chunks over the expires_at index
+        keeps each lock window short. Intended for a scheduled job,
+        not a request path.
+
+        Args:
+            session: Database session to use
+            batch_size (int): Rows deleted per round trip
+
+        Returns:
+            int: Total number of sessions deleted
+        """
+        now = datetime.utcnow()
+        total = 0
+        while True:
+            ids = [row[0] for row in session.query(cls.id)
+                   .filter(cls.expires_at < now)
+                   .limit(batch_size).all()]
+            if not ids:
+                return total
+            session.query(cls).filter(cls.id.in_(ids)).delete(
+                synchronize_session=False
+            )
+            session.commit()
+            total += len(ids)
@@ -51,30 +51,33 @@ class AuthenticationTests(unittest.TestCase):
     @patch('utils.redis_client.RedisClient.rate_limit', return_value=True)
     @patch('api.v1.auth.get_db')
     @patch('utils.password.verify_password')
+    @patch('utils.redis_client.RedisClient.pipeline')
     @patch('utils.redis_client.RedisClient.session_set')
     @patch('jwt.encode')
     def test_successful_login(
-        self, mock_jwt_encode, mock_session_set, mock_verify_password, mock_get_db, mock_rate_limit
+        self, mock_jwt_encode, mock_session_set, mock_pipeline, mock_verify_password, mock_get_db, mock_rate_limit
 ):
         """Test successful login."""
-        # Create mock role object
-        mock_role = MagicMock()
-        mock_role.name = 'user'
-
-        # Create mock user object with roles as objects having a 'name' attribute
+        # Create mock user object
         mock_user = MagicMock(
             id=1,
             username=self.login_credentials['username'],
             email=self.valid_user_data['email'],
             password=bcrypt.hashpw(self.login_credentials['password'].encode(), bcrypt.gensalt()).decode(),
             is_active=True,
-            roles=[mock_role]
         )
 
-        # Mock database query to return the mock user
+        # Mock database: first execute returns the user, second the role
+        # names, third the audit-log INSERT result
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_user
-        mock_get_db.return_value = iter([mock_db])
+        mock_user_result = MagicMock()
+        mock_user_result.scalars.return_value.first.return_value = mock_user
+        mock_roles_result = MagicMock()
+        mock_roles_result.scalars.return_value.all.return_value = ['user']
+        mock_db.execute.side_effect = [
+            mock_user_result, mock_roles_result, MagicMock()
+        ]
+        mock_get_db.return_value = mock_db
 
         # Mock password verification and JWT encoding
         mock_verify_password.return_value = True
@@ -97,8 +100,8 @@ class AuthenticationTests(unittest.TestCase):
         """Test login with an inactive user."""
         mock_user = self._create_mock_user(is_active=False)
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.first.return_value = mock_user
-        mock_get_db.return_value = iter([mock_db])
+        mock_db.execute.return_value.scalars.return_value.first.return_value = mock_user
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/auth/login", json=self.login_credentials
@@ -111,8 +114,8 @@ class AuthenticationTests(unittest.TestCase):
     def test_login_invalid_credentials(self, mock_get_db, mock_rate_limit):
         """Test login with invalid credentials."""
         mock_db = MagicMock()
-        mock_db.query.return_value.filter.return_value.first.return_value = None
-        mock_get_db.return_value = iter([mock_db])
+        mock_db.execute.return_value.scalars.return_value.first.return_value = None
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/auth/login", json={"username": "nonexistent", "password": "wrongpassword"}
@@ -129,6 +132,37 @@ class AuthenticationTests(unittest.TestCase):
         response = self.client.post("/api/v1/auth/login", json={"username": "test"})
         self.assertEqual(response.status_code, 400)
 
+    @patch("utils.redis_client.RedisClient.rate_limit", return_value=True)
+    @patch("api.v1.auth.get_db")
+    @patch("utils.password.hash_password", return_value="hashed")
+    def test_successful_registration(self, mock_hash_password, mock_get_db, mock_rate_limit):
+        """Test successful user registration."""
+        mock_db = MagicMock()
+        mock_get_db.return_value = mock_db
+
+        response = self.client.post("/api/v1/auth/register", json=self.valid_user_data)
+        self.assertEqual(response.status_code, 201)
+        response_data = response.get_json()
+        self.assertIn("id", response_data)
+        self.assertEqual(response_data["username"], self.valid_user_data["username"])
+
+    @patch("utils.redis_client.RedisClient.rate_limit", return_value=True)
+    @patch("api.v1.auth.get_db")
+    def test_register_duplicate_username(self, mock_get_db, mock_rate_limit):
+        """Test registration with a username that is already taken."""
+        from sqlalchemy.exc import IntegrityError
+
+        mock_db = MagicMock()
+        mock_db.flush.side_effect = IntegrityError(
+            "INSERT INTO users", {},
+            Exception("(1062, \"Duplicate entry 'testuser' for key 'users.username'\")")
+        )
+        mock_get_db.return_value = mock_db
+
+        response = self.client.post("/api/v1/auth/register", json=self.valid_user_data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Username is already in use")
+
     @patch("utils.redis_client.RedisClient.rate_limit", return_value=True)
     @patch("api.v1.auth.get_db")
     def test_password_reset_request(self, mock_get_db, mock_rate_limit):
@@ -136,7 +170,7 @@ class AuthenticationTests(unittest.TestCase):
         mock_user = MagicMock(email="test@example.com")
         mock_db = MagicMock()
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_user
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/auth/reset-password", json={"email": "test@example.com"}
@@ -172,7 +206,7 @@ class AuthenticationTests(unittest.TestCase):
 
         # Mock database query
         mock_db = MagicMock()
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         # Mock Redis session delete
         mock_session_delete.return_value = None
@@ -36,7 +36,7 @@ class CategoryEndpointTests(unittest.TestCase):
         """Test successful category creation."""
         mock_db = MagicMock()
         mock_db.query.return_value.filter_by.return_value.first.return_value = None
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/categories/",
@@ -55,7 +55,7 @@ class CategoryEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_category = MagicMock(id=1, name="Technology")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_category
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/categories/",
@@ -73,7 +73,7 @@ class CategoryEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_category = MagicMock(id=1, name="Technology")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_category
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         update_data = {"name": "Advanced Technology"}
 
@@ -93,7 +93,7 @@ class CategoryEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_category = MagicMock(id=1, name="Technology")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_category
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.delete(
             "/api/v1/categories/1",
@@ -109,8 +109,8 @@ class CategoryEndpointTests(unittest.TestCase):
         mock_categories = [
             MagicMock(id=i, name=f"Category {i}") for i in range(1, 6)
         ]
-        mock_db.query.return_value.all.return_value = mock_categories
-        mock_get_db.return_value = iter([mock_db])
+        mock_db.query.return_value.order_by.return_value.limit.return_value.offset.return_value.all.return_value = mock_categories
+        mock_get_db.return_value = mock_db
 
         response = self.client.get(
             "/api/v1/categories/",
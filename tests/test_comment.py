@@ -38,7 +38,7 @@ class CommentEndpointTests(unittest.TestCase):
         """Test successful comment creation."""
         mock_db = MagicMock()
         mock_db.query.return_value.filter_by.return_value.first.return_value = MagicMock(id=1)
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/comments/",
@@ -57,7 +57,7 @@ class CommentEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_comment = MagicMock(id=1, content="Old content")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_comment
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         update_data = {"content": "Updated comment content"}
 
@@ -77,7 +77,7 @@ class CommentEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_comment = MagicMock(id=1, content="This is a comment")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_comment
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.delete(
             "/api/v1/comments/1",
@@ -95,7 +95,7 @@ class CommentEndpointTests(unittest.TestCase):
             for i in range(1, 6)
         ]
         mock_db.query.return_value.filter_by.return_value.all.return_value = mock_comments
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.get(
             "/api/v1/comments/?post_id=1",
@@ -113,7 +113,7 @@ class CommentEndpointTests(unittest.TestCase):
         """Test creating a comment for a non-existent post."""
         mock_db = MagicMock()
         mock_db.query.return_value.filter_by.return_value.first.return_value = None
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/comments/",
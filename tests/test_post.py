@@ -54,7 +54,7 @@ class PostEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_category = MagicMock(spec=Category, id=1, name="Technology")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_category
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         # Send POST request
         response = self.client.post(
@@ -96,7 +96,7 @@ class PostEndpointTests(unittest.TestCase):
         ]
         mock_db.query.return_value.filter.return_value.order_by.return_value.offset.return_value.limit.return_value.all.return_value = mock_posts
         mock_db.query.return_value.filter.return_value.count.return_value = 10
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.get(
             "/api/v1/posts/?page=1&per_page=5",
@@ -37,7 +37,7 @@ class TagEndpointTests(unittest.TestCase):
         """Test successful tag creation."""
         mock_db = MagicMock()
         mock_db.query.return_value.filter_by.return_value.first.return_value = None
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/tags/",
@@ -56,7 +56,7 @@ class TagEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_tag = MagicMock(id=1, name="Python", slug="python")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_tag
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.post(
             "/api/v1/tags/",
@@ -74,7 +74,7 @@ class TagEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_tag = MagicMock(id=1, name="Python", slug="python")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_tag
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         update_data = {"name": "Advanced Python", "slug": "advanced-python"}
 
@@ -95,7 +95,7 @@ class TagEndpointTests(unittest.TestCase):
         mock_db = MagicMock()
         mock_tag = MagicMock(id=1, name="Python", slug="python")
         mock_db.query.return_value.filter_by.return_value.first.return_value = mock_tag
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.delete(
             "/api/v1/tags/1",
@@ -112,7 +112,7 @@ class TagEndpointTests(unittest.TestCase):
             MagicMock(id=i, name=f"Tag {i}", slug=f"tag-{i}") for i in range(1, 6)
         ]
         mock_db.query.return_value.all.return_value = mock_tags
-        mock_get_db.return_value = iter([mock_db])
+        mock_get_db.return_value = mock_db
 
         response = self.client.get(
             "/api/v1/tags/",
@@ -0,0 +1,86 @@
+#!/usr/bin/python3
+"""
+Asynchronous audit logging utilities.
+
+Audit entries are not on the client's critical path: handlers enqueue
+them onto a Redis list and a worker drains the list into audit_logs in
+batches, so mutating requests shave the synchronous audit INSERT and
+many entries amortize into one executemany write.
+"""
+import json
+import logging
+
+from sqlalchemy import insert
+
+from models.audit_log import AuditLog, AuditActionType
+from utils.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+redis_client = RedisClient()
+
+AUDIT_QUEUE_KEY = 'audit:queue'
+
+
+def queue_audit(user_id, action, entity_type, entity_id, changes,
+                ip_address=None, user_agent=None):
+    """
+    Enqueue an audit entry for background insertion.
+
+    Mirrors AuditLog.log_action's argument shape. Audit logging is
+    best-effort on this path: a Redis failure is logged, not raised,
+    so it can never fail the business request.
+
+    Args:
+        user_id: ID of user performing action
+        action: AuditActionType enum value
+        entity_type: Type of entity affected
+        entity_id: ID of affected entity
+        changes: Dict of changes to be JSON serialized
+        ip_address: Origin IP address
+        user_agent: Browser/client user agent string
+    """
+    entry = {
+        'user_id': user_id,
+        'action': action.value,
+        'entity_type': entity_type,
+        'entity_id': entity_id,
+        'changes': json.dumps(changes) if changes else None,
+        'ip_address': ip_address,
+        'user_agent': user_agent
+    }
+    try:
+        redis_client.client.rpush(AUDIT_QUEUE_KEY, json.dumps(entry))
+    except Exception as e:
+        logger.error(f"Failed to queue audit entry: {e}")
+
+
+def drain_audit_queue(session, batch_size=500):
+    """
+    Drain queued audit entries into the database.
+
+    Intended for a scheduled worker, not a request path. Each batch of
+    up to batch_size entries is written with a single executemany
+    INSERT and its own commit.
+
+    Args:
+        session: Database session to use
+        batch_size (int): Entries written per round trip
+
+    Returns:
+        int: Total number of entries written
+    """
+    total = 0
+    while True:
+        raw = redis_client.client.lpop(AUDIT_QUEUE_KEY, batch_size)
+        if not raw:
+            return total
+        rows = []
+        for item in raw:
+            entry = json.loads(item)
+            entry['action'] = AuditActionType(entry['action'])
+            rows.append(entry)
+        session.execute(insert(AuditLog.__table__), rows)
+        session.commit()
+        total += len(rows)
+        if len(raw) < batch_size:
+            return total
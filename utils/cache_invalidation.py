@@ -0,0 +1,61 @@
+#!/usr/bin/python3
+"""
+ORM-event safety net for Redis cache invalidation.
+
+Endpoints invalidate (or write-through patch) their own cache keys;
+these listeners back them up so an ORM-mediated Post change from a new
+or future endpoint cannot silently serve stale data. Keys collect on
+the flushing session and are deleted only after the transaction
+commits, so a rolled-back change never evicts warm entries.
+
+Two deliberate limits: Core insert/update/delete statements bypass ORM
+events, so paths built on them keep their explicit invalidation; and
+Comment is not hooked because the comment endpoints patch the cached
+list in place — a blanket delete here would defeat that.
+"""
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.orm import object_session
+
+from config.database import SessionLocal
+from models.post import Post
+from utils.redis_client import RedisClient
+
+logger = logging.getLogger(__name__)
+redis_client = RedisClient()
+
+_SESSION_INFO_KEY = 'pending_cache_invalidations'
+
+
+def _queue_keys(target, *keys):
+    """Collect keys on the target's session; deleted after commit."""
+    session = object_session(target)
+    if session is None:
+        return
+    session.info.setdefault(_SESSION_INFO_KEY, set()).update(keys)
+
+
+@event.listens_for(Post, 'after_update')
+@event.listens_for(Post, 'after_delete')
+def _post_changed(mapper, connection, target):
+    _queue_keys(target, f'post:{target.slug}', f'post:exists:{target.id}')
+
+
+@event.listens_for(SessionLocal, 'after_commit')
+def _flush_invalidations(session):
+    keys = session.info.pop(_SESSION_INFO_KEY, None)
+    if not keys:
+        return
+    try:
+        pipe = redis_client.pipeline()
+        for key in keys:
+            pipe.delete(key)
+        pipe.execute()
+    except Exception as e:
+        logger.error(f"Post-commit cache invalidation failed: {e}")
+
+
+@event.listens_for(SessionLocal, 'after_rollback')
+def _discard_invalidations(session):
+    session.info.pop(_SESSION_INFO_KEY, None)
@@ -0,0 +1,34 @@
+#!/usr/bin/python3
+"""
+orjson-backed JSON provider for Flask.
+
+Swapping Flask's default stdlib-json provider for orjson speeds up
+response serialization severalfold on list-heavy endpoints, with
+native datetime support.
+
+Classes:
+    OrjsonProvider: Flask JSONProvider backed by orjson
+"""
+import orjson
+from flask.json.provider import JSONProvider
+
+
+class OrjsonProvider(JSONProvider):
+    """
+    Flask JSON provider that serializes with orjson.
+
+    orjson's C encoder is 2-5x faster than the stdlib json module and
+    serializes datetime objects natively (rendered as UTC with a Z
+    suffix), so jsonify and request.get_json both go through it once
+    this is installed as app.json.
+    """
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to JSON bytes."""
+        return orjson.dumps(
+            obj, option=orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z
+        )
+
+    def loads(self, s, **kwargs):
+        """Deserialize JSON from a str or bytes."""
+        return orjson.loads(s)
@@ -2,30 +2,56 @@
 """
 Password utility module for secure password handling.
 
-This module provides functions for password hashing and verification
-using bcrypt encryption.
+This module provides functions for password hashing and verification.
+New hashes use argon2id (memory-hard, SIMD-accelerated Blake2b core);
+legacy bcrypt hashes are still verified and are transparently upgraded
+on the next successful login (see needs_rehash).
 """
 import bcrypt
-from typing import Tuple
+import hmac
+import os
+from concurrent.futures import ThreadPoolExecutor
 
-def hash_password(password: str) -> Tuple[str, str]:
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHash, VerificationError
+
+# argon2id parameters, resolved once at import; tunable per host so ops
+# can target a latency budget on the actual CPU (defaults follow the
+# argon2-cffi recommendations: 3 passes over 64 MiB).
+ARGON2_TIME_COST = int(os.environ.get('ARGON2_TIME_COST', 3))
+ARGON2_MEMORY_COST = int(os.environ.get('ARGON2_MEMORY_COST', 64 * 1024))
+
+_PH = PasswordHasher(
+    time_cost=ARGON2_TIME_COST,
+    memory_cost=ARGON2_MEMORY_COST,
+    parallelism=1
+)
+
+# Both argon2 and bcrypt release the GIL in their C cores, so running
+# them on a bounded pool lets up to one hash per core proceed in
+# parallel without blocking the Flask worker threads.
+_HASH_POOL = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+
+def hash_password(password: str) -> str:
     """
-    Hash a password using bcrypt with salt.
+    Hash a password with argon2id.
 
     Args:
         password: Plain text password
 
     Returns:
-        Tuple[str, str]: (hashed password, salt)
+        str: Encoded hash (parameters and salt are embedded)
     """
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
-    return hashed.decode('utf-8'), salt.decode('utf-8')
+    return _HASH_POOL.submit(_PH.hash, password).result()
+
 
 def verify_password(password: str, hashed: str) -> bool:
     """
     Verify a password against its hash.
 
+    Handles both current argon2 hashes and legacy bcrypt ones.
+
     Args:
         password: Plain text password to verify
         hashed: Stored hash to check against
@@ -33,7 +59,48 @@ def verify_password(password: str, hashed: str) -> bool:
     Returns:
         bool: True if password matches, False otherwise
     """
-    return bcrypt.checkpw(
+    if hashed.startswith('$argon2'):
+        try:
+            return _HASH_POOL.submit(_PH.verify, hashed, password).result()
+        except (VerificationError, InvalidHash):
+            return False
+
+    # Legacy bcrypt hash
+    return _HASH_POOL.submit(
+        bcrypt.checkpw,
         password.encode('utf-8'),
         hashed.encode('utf-8')
-    )
+    ).result()
+
+
+def safe_equals(a: str, b: str) -> bool:
+    """
+    Compare two secrets (reset tokens, session tokens) in constant time.
+
+    A plain `==` short-circuits on the first differing byte and leaks
+    timing information; all in-process token comparisons must go
+    through this helper instead.
+
+    Args:
+        a: First value
+        b: Second value
+
+    Returns:
+        bool: True if the values are equal
+    """
+    return hmac.compare_digest(a.encode('utf-8'), b.encode('utf-8'))
+
+
+def needs_rehash(hashed: str) -> bool:
+    """
+    Check whether a stored hash predates the current scheme/parameters.
+
+    Args:
+        hashed: Stored hash to inspect
+
+    Returns:
+        bool: True if the password should be rehashed on next login
+    """
+    if not hashed.startswith('$argon2'):
+        return True
+    return _PH.check_needs_rehash(hashed)
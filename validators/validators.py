@@ -8,6 +8,14 @@ they meet the required format and constraints.
 import re
 from typing import Optional
 
+# Compiled once at import: validators run on every model assignment,
+# and per-call re.compile/cache lookups add up on the write paths.
+# All patterns are backtracking-safe (single character classes).
+_USERNAME_RE = re.compile(r'^[a-zA-Z0-9_-]+$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEP_RE = re.compile(r'[-\s]+')
+
 def validate_username(username: str) -> str:
     """
     Validate username format.
@@ -28,7 +36,7 @@ def validate_username(username: str) -> str:
         raise ValueError("Username must be between 3 and 30 characters")
     
     # Allow letters, numbers, underscore, hyphen
-    if not re.match(r'^[a-zA-Z0-9_-]+$', username):
+    if not _USERNAME_RE.match(username):
         raise ValueError("Username can only contain letters, numbers, underscore, and hyphen")
     
     return username
@@ -50,12 +58,48 @@ def validate_email(email: str) -> str:
         raise ValueError("Email cannot be empty")
     
     # Basic email format validation
-    email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    if not re.match(email_pattern, email):
+    if not _EMAIL_RE.match(email):
         raise ValueError("Invalid email format")
     
     return email.lower()
 
+def validate_password(password: str) -> str:
+    """
+    Validate password strength.
+
+    Args:
+        password: Password to validate
+
+    Returns:
+        str: Validated password
+
+    Raises:
+        ValueError: If the password is too short or is missing a
+            required character class
+    """
+    if not password:
+        raise ValueError("Password cannot be empty")
+
+    if len(password) < 8:
+        raise ValueError("Password must be at least 8 characters")
+
+    # One pass accumulating class flags, instead of a full scan per
+    # class; bails out as soon as all three are seen
+    has_upper = has_lower = has_digit = False
+    for ch in password:
+        if ch.isupper():
+            has_upper = True
+        elif ch.islower():
+            has_lower = True
+        elif ch.isdigit():
+            has_digit = True
+        if has_upper and has_lower and has_digit:
+            return password
+
+    raise ValueError(
+        "Password must contain uppercase, lowercase, and numeric characters"
+    )
+
 def validate_slug(slug: str) -> str:
     """
     Validate and format URL slug.
@@ -74,8 +118,8 @@ def validate_slug(slug: str) -> str:
     
     # Convert to lowercase and replace spaces with hyphens
     slug = slug.lower().strip()
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
+    slug = _SLUG_STRIP_RE.sub('', slug)
+    slug = _SLUG_SEP_RE.sub('-', slug)
     
     if len(slug) > 250:
         raise ValueError("Slug must be less than 250 characters")